@@ -5,6 +5,7 @@ Global state management for the quiz.
 """
 
 import time
+import threading
 from data.quiz_data import QUESTIONS
 
 # Quiz phases
@@ -27,6 +28,9 @@ quiz_state = {
     "options_revealed": False
 }
 
+# Signalled on every state change so long-poll requests can wake up
+state_changed = threading.Condition()
+
 
 def reset_state():
     """Reset all quiz state to initial values."""
@@ -78,3 +82,15 @@ def save_current_rankings():
     from core.scoring import get_rankings
     rankings = get_rankings(quiz_state["player_scores"])
     quiz_state["previous_rankings"] = {pid: rank for pid, _, rank in rankings}
+
+
+def notify_state_change():
+    """Wake up all long-poll requests waiting for a state change."""
+    with state_changed:
+        state_changed.notify_all()
+
+
+def wait_for_state_change(predicate, timeout: float) -> bool:
+    """Block until predicate() is true or timeout expires. Returns predicate result."""
+    with state_changed:
+        return state_changed.wait_for(predicate, timeout)
@@ -4,17 +4,65 @@ Nao Robot API Routes Module
 REST API endpoints for Nao robot control.
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from data.quiz_data import QUESTIONS
 from core.state import (
     quiz_state, get_current_question_data, reset_state,
     start_answer_timer, get_answer_distribution, save_current_rankings,
-    PHASE_WAITING, PHASE_QUESTION, PHASE_ANSWERING, PHASE_RESULTS, PHASE_LEADERBOARD
+    notify_state_change, wait_for_state_change,
+    PHASE_WAITING, PHASE_QUESTION, PHASE_RESULTS, PHASE_LEADERBOARD
 )
 from core.scoring import calculate_score, get_rankings, calculate_rank_changes
 
 nao_api_bp = Blueprint('nao_api', __name__, url_prefix='/api')
 
+MAX_LONG_POLL_SECONDS = 30  # Upper bound for how long a long-poll request is held open
+
+
+def _status_payload():
+    """Quiz status dict shared by /status and /session."""
+    return {
+        "is_active": quiz_state["is_active"],
+        "phase": quiz_state["phase"],
+        "current_question": quiz_state["current_question"],
+        "total_questions": len(QUESTIONS),
+        "player_count": len(quiz_state["players"]),
+        "answered_count": len(quiz_state["current_answers"]),
+        "options_revealed": quiz_state["options_revealed"],
+        "current_question_data": get_current_question_data()
+    }
+
+
+def _results_payload(question):
+    """Answer results for the current question, shared by /results and /session."""
+    distribution = get_answer_distribution()
+    return {
+        "distribution": distribution,
+        "correct_answer": question["correct_answer"],
+        "correct_count": distribution.get(question["correct_answer"], 0),
+        "total_players": len(quiz_state["players"]),
+        "answered_count": len(quiz_state["current_answers"])
+    }
+
+
+def _wait_for_player_change_if_requested():
+    """Long-poll support: block while ?wait_for_change=1 and player count == ?since."""
+    if request.args.get('wait_for_change'):
+        since = request.args.get('since', 0, type=int)
+        timeout = min(request.args.get('timeout', 25, type=float), MAX_LONG_POLL_SECONDS)
+        wait_for_state_change(lambda: len(quiz_state["players"]) != since, max(timeout, 0))
+
+
+def _wait_for_answer_change_if_requested():
+    """Long-poll support: block while ?wait_for_answers=1, answered count == ?since and not everyone answered."""
+    if request.args.get('wait_for_answers'):
+        since = request.args.get('since', 0, type=int)
+        timeout = min(request.args.get('timeout', 10, type=float), MAX_LONG_POLL_SECONDS)
+        wait_for_state_change(
+            lambda: (len(quiz_state["current_answers"]) != since
+                     or len(quiz_state["current_answers"]) >= len(quiz_state["players"])),
+            max(timeout, 0))
+
 
 @nao_api_bp.route('/players', methods=['GET'])
 def get_players():
@@ -25,22 +73,54 @@ def get_players():
 
 @nao_api_bp.route('/status', methods=['GET'])
 def status():
-    """Get complete quiz status."""
+    """
+    Get complete quiz status.
+
+    Long-poll: with ?wait_for_change=1&since=<player_count>&timeout=<s> the
+    request is held open until the player count differs from `since` or the
+    timeout expires.
+    """
+    _wait_for_player_change_if_requested()
+
+    return jsonify(_status_payload())
+
+
+@nao_api_bp.route('/session', methods=['GET'])
+def session():
+    """
+    Bulk poll: everything /status returns plus the /results payload
+    ("results", null when no question is active) in one request.
+
+    Long-poll: with ?wait_for_answers=1&since=<answered_count>&timeout=<s> the
+    request is held open until someone answers or everyone has answered.
+    """
+    _wait_for_answer_change_if_requested()
+
+    payload = _status_payload()
+    question = payload["current_question_data"]
+    payload["results"] = _results_payload(question) if question else None
+    return jsonify(payload)
+
+
+@nao_api_bp.route('/lobby', methods=['GET'])
+def lobby():
+    """
+    Lobby snapshot: phase, player count and player names in one call.
+    Supports the same long-poll parameters as /status.
+    """
+    _wait_for_player_change_if_requested()
+
+    player_names = [p.get("name", "Unknown") for p in quiz_state["players"].values()]
     return jsonify({
-        "is_active": quiz_state["is_active"],
         "phase": quiz_state["phase"],
-        "current_question": quiz_state["current_question"],
-        "total_questions": len(QUESTIONS),
-        "player_count": len(quiz_state["players"]),
-        "answered_count": len(quiz_state["current_answers"]),
-        "options_revealed": quiz_state["options_revealed"],
-        "current_question_data": get_current_question_data()
+        "player_count": len(player_names),
+        "players": player_names
     })
 
 
 @nao_api_bp.route('/start', methods=['POST'])
 def start():
-    """Start the quiz at first question."""
+    """Start the quiz at first question. The response includes the quiz status ("status")."""
     quiz_state["is_active"] = True
     quiz_state["current_question"] = 0
     quiz_state["current_answers"] = {}
@@ -52,7 +132,8 @@ def start():
         if player_id not in quiz_state["player_scores"]:
             quiz_state["player_scores"][player_id] = 0
 
-    return jsonify({"success": True, "message": "Quiz started"})
+    notify_state_change()
+    return jsonify({"success": True, "message": "Quiz started", "status": _status_payload()})
 
 
 @nao_api_bp.route('/reveal_options', methods=['POST'])
@@ -101,6 +182,7 @@ def show_answers():
         "correct_answer_letter": chr(65 + correct_idx),  # A, B, C, or D
         "correct_answer_text": question["options"][correct_idx],
         "correct_players": correct_players,
+        "correct_count": len(correct_players),
         "wrong_players": wrong_players
     })
 
@@ -138,7 +220,7 @@ def get_leaderboard_data():
 
 @nao_api_bp.route('/next', methods=['POST'])
 def next_question():
-    """Move to next question."""
+    """Move to next question. The response includes the new quiz status ("status")."""
     current = quiz_state["current_question"]
 
     # Save rankings before moving to next question
@@ -150,11 +232,13 @@ def next_question():
         quiz_state["options_revealed"] = False
         quiz_state["question_start_time"] = None
         quiz_state["phase"] = PHASE_QUESTION
-        return jsonify({"success": True, "message": "Next question"})
+        notify_state_change()
+        return jsonify({"success": True, "message": "Next question", "status": _status_payload()})
     else:
         quiz_state["is_active"] = False
         quiz_state["phase"] = PHASE_WAITING
-        return jsonify({"success": True, "message": "Quiz finished"})
+        notify_state_change()
+        return jsonify({"success": True, "message": "Quiz finished", "status": _status_payload()})
 
 
 @nao_api_bp.route('/results', methods=['GET'])
@@ -164,16 +248,12 @@ def results():
     if not question:
         return jsonify({"error": "No active question"}), 400
 
-    return jsonify({
-        "distribution": get_answer_distribution(),
-        "correct_answer": question["correct_answer"],
-        "total_players": len(quiz_state["players"]),
-        "answered_count": len(quiz_state["current_answers"])
-    })
+    return jsonify(_results_payload(question))
 
 
 @nao_api_bp.route('/reset', methods=['POST'])
 def reset():
     """Reset entire quiz."""
     reset_state()
+    notify_state_change()
     return jsonify({"success": True, "message": "Quiz reset"})
@@ -6,7 +6,7 @@ REST API endpoints for player actions.
 
 from flask import Blueprint, request, jsonify
 import uuid
-from core.state import quiz_state, get_current_question_data, get_answer_time
+from core.state import quiz_state, get_current_question_data, get_answer_time, notify_state_change
 
 player_api_bp = Blueprint('player_api', __name__, url_prefix='/api/player')
 
@@ -23,6 +23,7 @@ def join():
         "answers": []
     }
     quiz_state["player_scores"][player_id] = 0
+    notify_state_change()
 
     return jsonify({"player_id": player_id, "player_name": player_name})
 
@@ -55,6 +56,7 @@ def answer():
         "answer": answer_idx,
         "time": answer_time
     })
+    notify_state_change()
 
     return jsonify({"success": True})
 
@@ -4,10 +4,29 @@ Server Connection Module
 API wrapper for communicating with Kahoot server.
 """
 
+import time
+import random
+import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List
 
+try:
+    import orjson
+    _loads = orjson.loads  # Faster decoding of the polled status payloads
+except ImportError:
+    import json
+    _loads = json.loads
+
 SERVER_URL = "http://localhost:5000"
+REQUEST_TIMEOUT = (0.5, 2.0)  # (connect, read) seconds for regular calls
+BACKOFF_BASE = 0.5  # Delay (s) before the next call after a connection failure, doubles per failure
+BACKOFF_MAX = 8.0   # Cap for that delay (plus up to BACKOFF_BASE jitter)
+
+# Polling reads log at DEBUG, quiz actions at INFO
+log = logging.getLogger("nao.api")
 
 
 class KahootAPI:
@@ -15,129 +34,266 @@ class KahootAPI:
 
     def __init__(self, server_url: str):
         self.server_url = server_url
-        print(f"[API] Initialized with server: {server_url}")
+
+        # One keep-alive session for all calls instead of a new connection each time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            # Retries never resend a non-idempotent POST after it reached the server
+            max_retries=Retry(total=2, connect=1, read=1, backoff_factor=0.1,
+                              status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+
+        # Consecutive connection failures; every caller backs off while the server is down.
+        # The API pool and the main thread update it, so it is guarded by a lock.
+        self._failures = 0
+        self._failures_lock = threading.Lock()
+        log.info("[API] Initialized with server: %s", server_url)
+
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _backoff(self, max_wait: Optional[float] = None) -> float:
+        """
+        After failed calls, sleep with exponential backoff + jitter (at most
+        max_wait seconds, the caller's remaining time). Returns the seconds slept.
+        """
+        with self._failures_lock:
+            failures = self._failures
+        if not failures:
+            return 0.0
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1))
+        delay += random.uniform(0, BACKOFF_BASE)
+        if max_wait is not None:
+            delay = min(delay, max(0.0, max_wait))
+        time.sleep(delay)
+        return delay
+
+    def _request(self, method: str, path: str, backoff: bool = True, **kwargs) -> requests.Response:
+        """
+        Send a request on the shared session.
+        After connection errors, timeouts and 5xx responses the next call
+        first backs off, so polling loops don't hammer a server that is down
+        or failing. Any response below 500 resets the backoff. Callers with a
+        deadline back off themselves via _backoff(max_wait) and pass backoff=False.
+        """
+        if backoff:
+            self._backoff()
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        try:
+            response = self.session.request(method, f"{self.server_url}{path}", **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            with self._failures_lock:
+                self._failures += 1
+            raise
+        # A 4xx is an answer from a healthy server; only server errors back off
+        with self._failures_lock:
+            self._failures = self._failures + 1 if response.status_code >= 500 else 0
+        return response
 
     def get_players(self) -> List[str]:
         """Get list of player names."""
-        print("[API] Getting players...")
+        log.debug("[API] Getting players...")
         try:
-            response = requests.get(f"{self.server_url}/api/players")
+            response = self._request("GET", "/api/players")
             response.raise_for_status()
-            data = response.json()
-            print(f"[API] Players: {data}")
+            data = _loads(response.content)
+            log.debug("[API] Players: %s", data)
             return data
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return []
 
     def get_status(self) -> Dict:
         """Get complete quiz status."""
-        print("[API] Getting status...")
+        log.debug("[API] Getting status...")
         try:
-            response = requests.get(f"{self.server_url}/api/status")
+            response = self._request("GET", "/api/status")
             response.raise_for_status()
-            data = response.json()
-            print(f"[API] Phase: {data.get('phase')}, Q: {data.get('current_question')}/{data.get('total_questions')}")
+            data = _loads(response.content)
+            log.debug("[API] Phase: %s, Q: %s/%s", data.get('phase'), data.get('current_question'), data.get('total_questions'))
             return data
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return {}
 
-    def start_quiz(self) -> bool:
-        """Start the quiz."""
-        print("[API] Starting quiz...")
+    def get_session(self) -> Dict:
+        """
+        Get quiz status plus current results in one call.
+        Same keys as get_status(), plus "results" (None when no question is active).
+        """
+        log.debug("[API] Getting session...")
         try:
-            response = requests.post(f"{self.server_url}/api/start")
+            response = self._request("GET", "/api/session")
             response.raise_for_status()
-            print(f"[API] Quiz started")
-            return response.json().get('success', False)
+            data = _loads(response.content)
+            log.debug("[API] Phase: %s, Q: %s/%s, Answered: %s/%s",
+                      data.get('phase'), data.get('current_question'), data.get('total_questions'),
+                      data.get('answered_count'), data.get('player_count'))
+            return data
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
-            return False
+            log.error("[API] ERROR: %s", e)
+            return {}
+
+    def wait_for_player_change(self, since_count: int, timeout: float = 25) -> Dict:
+        """
+        Long-poll the lobby snapshot until the player count differs from since_count.
+        Returns as soon as a player joins, or after timeout seconds.
+        """
+        log.debug("[API] Waiting for players (have %d, max %.0fs)...", since_count, timeout)
+        timeout = max(0.0, timeout - self._backoff(max_wait=timeout))
+        try:
+            response = self._request(
+                "GET", "/api/lobby", backoff=False,
+                params={"wait_for_change": 1, "since": since_count, "timeout": timeout},
+                timeout=(REQUEST_TIMEOUT[0], timeout + 5),
+            )
+            response.raise_for_status()
+            data = _loads(response.content)
+            log.debug("[API] Players: %s", data.get('players'))
+            return data
+        except requests.exceptions.RequestException as e:
+            log.error("[API] ERROR: %s", e)
+            return {}
+
+    def wait_for_answer_change(self, since_count: int, timeout: float = 10) -> Dict:
+        """
+        Long-poll the session until the answered count differs from since_count
+        (or everyone has answered). Returns after at most timeout seconds.
+        """
+        log.debug("[API] Waiting for answers (have %d, max %.1fs)...", since_count, timeout)
+        timeout = max(0.0, timeout - self._backoff(max_wait=timeout))
+        try:
+            response = self._request(
+                "GET", "/api/session", backoff=False,
+                params={"wait_for_answers": 1, "since": since_count, "timeout": timeout},
+                timeout=(REQUEST_TIMEOUT[0], timeout + 5),
+            )
+            response.raise_for_status()
+            data = _loads(response.content)
+            log.debug("[API] Answered: %s/%s", data.get('answered_count'), data.get('player_count'))
+            return data
+        except requests.exceptions.RequestException as e:
+            log.error("[API] ERROR: %s", e)
+            return {}
+
+    def start_quiz(self) -> Dict:
+        """
+        Start the quiz.
+        Returns the quiz status at the first question (same keys as get_status()), {} on error.
+        """
+        log.info("[API] Starting quiz...")
+        try:
+            response = self._request("POST", "/api/start")
+            response.raise_for_status()
+            log.info("[API] Quiz started")
+            return _loads(response.content).get('status') or {}
+        except requests.exceptions.RequestException as e:
+            log.error("[API] ERROR: %s", e)
+            return {}
 
     def reveal_options(self) -> bool:
         """Reveal answer options and start timer."""
-        print("[API] Revealing options...")
+        log.info("[API] Revealing options...")
         try:
-            response = requests.post(f"{self.server_url}/api/reveal_options")
+            response = self._request("POST", "/api/reveal_options")
             response.raise_for_status()
-            print(f"[API] Options revealed")
-            return response.json().get('success', False)
+            log.info("[API] Options revealed")
+            return _loads(response.content).get('success', False)
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return False
 
     def show_answers(self) -> Optional[Dict]:
         """Close answering and show answer distribution."""
-        print("[API] Showing answers...")
+        log.info("[API] Showing answers...")
         try:
-            response = requests.post(f"{self.server_url}/api/show_answers")
+            response = self._request("POST", "/api/show_answers")
             response.raise_for_status()
-            data = response.json()
-            print(f"[API] Distribution: {data.get('distribution')}, Correct: {data.get('correct_answer')}")
+            data = _loads(response.content)
+            log.info("[API] Distribution: %s, Correct: %s", data.get('distribution'), data.get('correct_answer'))
             return data
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return None
 
     def show_leaderboard(self) -> Optional[List[Dict]]:
         """Show top 10 leaderboard with rank changes."""
-        print("[API] Showing leaderboard...")
+        log.info("[API] Showing leaderboard...")
         try:
-            response = requests.post(f"{self.server_url}/api/show_leaderboard")
+            response = self._request("POST", "/api/show_leaderboard")
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             leaderboard = data.get('leaderboard', [])
-            for entry in leaderboard[:5]:
-                print(f"[API]   #{entry['rank']} {entry['name']}: {entry['score']} ({entry['change']:+d})")
+            # One log record for the top 5, only built when INFO is enabled
+            if log.isEnabledFor(logging.INFO):
+                log.info("[API] Top 5:\n%s", "\n".join(
+                    "[API]   #%s %s: %s (%+d)" % (e['rank'], e['name'], e['score'], e['change'])
+                    for e in leaderboard[:5]))
             return leaderboard
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return None
 
-    def next_question(self) -> bool:
-        """Move to next question."""
-        print("[API] Next question...")
+    def next_question(self) -> Dict:
+        """
+        Move to next question.
+        Returns the new quiz status (same keys as get_status()), {} on error.
+        """
+        log.info("[API] Next question...")
         try:
-            response = requests.post(f"{self.server_url}/api/next")
+            response = self._request("POST", "/api/next")
             response.raise_for_status()
-            data = response.json()
-            print(f"[API] {data.get('message')}")
-            return data.get('success', False)
+            data = _loads(response.content)
+            log.info("[API] %s", data.get('message'))
+            return data.get('status') or {}
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
-            return False
+            log.error("[API] ERROR: %s", e)
+            return {}
 
     def get_results(self) -> Optional[Dict]:
         """Get results for current question."""
-        print("[API] Getting results...")
+        log.debug("[API] Getting results...")
         try:
-            response = requests.get(f"{self.server_url}/api/results")
+            response = self._request("GET", "/api/results")
             response.raise_for_status()
-            data = response.json()
-            print(f"[API] Answered: {data.get('answered_count')}/{data.get('total_players')}")
+            data = _loads(response.content)
+            log.debug("[API] Answered: %s/%s", data.get('answered_count'), data.get('total_players'))
             return data
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return None
 
     def reset_quiz(self) -> bool:
         """Reset entire quiz."""
-        print("[API] Resetting quiz...")
+        log.info("[API] Resetting quiz...")
         try:
-            response = requests.post(f"{self.server_url}/api/reset")
+            response = self._request("POST", "/api/reset")
             response.raise_for_status()
-            print(f"[API] Quiz reset")
-            return response.json().get('success', False)
+            log.info("[API] Quiz reset")
+            return _loads(response.content).get('success', False)
         except requests.exceptions.RequestException as e:
-            print(f"[API] ERROR: {e}")
+            log.error("[API] ERROR: %s", e)
             return False
 
 
 # Test connection when run directly
 if __name__ == "__main__":
-    api = KahootAPI(SERVER_URL)
-    print("\n--- Testing API ---")
-    api.get_status()
-    api.get_players()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log.setLevel(logging.DEBUG)
+    with KahootAPI(SERVER_URL) as api:
+        print("\n--- Testing API ---")
+        api.get_status()
+        api.get_players()
 
@@ -0,0 +1,63 @@
+"""
+Logging Setup
+=============
+Queue-based logging for the NAO host.
+
+Hot loops (gaze ticks, walking) only put a record on a queue; a background
+QueueListener thread does the actual console writes.
+
+Usage:
+    from log_config import setup_logging
+    setup_logging()                       # once, at startup
+
+    log = logging.getLogger("nao.show")   # in any module
+    log.debug("[NaoShowController] set_head(): yaw=%.3f", yaw)
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = "nao"  # Parent logger for all NAO host modules ("nao.show", ...)
+
+_listener = None
+_queue_handler = None
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Configure the "nao" logger with a QueueHandler + QueueListener.
+    Has its own level and handler (propagate=False), so NaoListener's
+    quiet mode on the root logger does not affect it.
+    """
+    global _listener, _queue_handler
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+
+    if _listener is None:
+        log_queue = queue.Queue(-1)
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter("%(message)s"))
+        _listener = QueueListener(log_queue, console)
+        _listener.start()
+        _queue_handler = QueueHandler(log_queue)
+        logger.addHandler(_queue_handler)
+        logger.propagate = False
+
+    return logger
+
+
+def stop_logging():
+    """
+    Flush queued records, stop the listener thread and detach the
+    QueueHandler, so later records are not queued with nobody to write them.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.removeHandler(_queue_handler)
+        logger.propagate = True
+        _queue_handler = None
@@ -10,8 +10,11 @@ Date: 2025
 
 import time
 import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
 from os.path import abspath, join
-from dotenv import load_dotenv
 
 # SIC Framework imports
 from sic_framework.devices import Nao
@@ -22,14 +25,21 @@ from sic_framework.devices.common_naoqi.naoqi_motion import (
 )
 from sic_framework.devices.common_naoqi.naoqi_autonomous import (
     NaoWakeUpRequest,
-    NaoRestRequest,
 )
 
 # Local imports
+from log_config import setup_logging, stop_logging
 from api.kahoot_api import KahootAPI
 from speech.listener import NaoListener
-from speech.llm import stream_llm_response_to_nao
-from robot.show_controller import NaoShowController
+from speech.llm import (
+    stream_llm_response_to_nao,
+    open_llm_stream,
+    get_llm_response_groq,
+    say_llm_text,
+    warm_up_llm,
+)
+from robot.show_controller import NaoShowController, QI_SERVICES
+from robot.qi_session import preconnect
 from prompts import (
     PROMPT_PLAYER_NAMES,
     PROMPT_WRONG_ANSWER,
@@ -39,14 +49,12 @@ from prompts import (
     PROMPT_WINNER,
     PROMPT_LOSER,
     COHOST_QUESTIONS,
+    THINKING_FILLERS,
     PROMPT_COHOST_DIRECT,
     PROMPT_COHOST_SILENT,
     PROMPT_WRONG_ANSWER_TRANSITION,
 )
 
-# Load environment variables (for GROQ_API_KEY)
-load_dotenv()
-
 
 # =============================================================================
 # CONFIGURATION
@@ -56,6 +64,17 @@ NAO_IP = "10.0.0.239"
 SERVER_URL = "http://localhost:5000"
 GOOGLE_KEY = abspath(join("..", "..", "conf", "google", "google-key.json"))
 JOIN_WAIT_TIME = 60  # Seconds to wait for players to join before starting quiz
+LOBBY_POLL_TIMEOUT = 25  # Max seconds one lobby long-poll is held open by the server
+ANSWER_RETRY_DELAY = 0.5  # Pause (s) before re-polling answers after a failed request
+OPTION_PREFIXES = ("A, ", "B, ", "C, ", "D, ")  # Spoken before each option (server enforces 4)
+OPTION_SEPARATOR = ". \\pau=800\\ "  # TTS pause between options, inside the single options line
+
+# (message, prompt) of LLM jokes with fixed input, kept generated in advance
+SILENT_COHOST_JOKE = ("The co-host didn't respond", PROMPT_COHOST_SILENT)
+DIRECT_COHOST_JOKE = ("Make a direct jab at the co-host", PROMPT_COHOST_DIRECT)
+
+# Per-poll progress lines log at DEBUG (phase banners stay plain prints)
+log = logging.getLogger("nao.quiz")
 
 
 # =============================================================================
@@ -84,6 +103,11 @@ class NaoQuizMaster:
         self.nao_ip = nao_ip
         self.join_wait_time = join_wait_time
         
+        # The show controller's direct qi session doesn't depend on SIC,
+        # so it connects in the background while SIC connects and sets up STT
+        threading.Thread(target=preconnect, args=(nao_ip, QI_SERVICES),
+                         name="qi-connect", daemon=True).start()
+        
         # Connect to NAO (single connection)
         print(f"[INIT] Connecting to NAO at {nao_ip}...")
         self.nao = Nao(ip=nao_ip)
@@ -97,6 +121,15 @@ class NaoQuizMaster:
         # Connect to Kahoot server API
         print(f"[INIT] Connecting to server at {server_url}...")
         self.api = KahootAPI(server_url)
+        # Runs server calls that don't need to finish before NAO starts talking
+        self._api_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="kahoot-api")
+        # Single worker = speech queue: lines are spoken in order, back-to-back
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nao-tts")
+        # Background LLM requests get their own threads, so a slow Groq call never
+        # delays a time-critical server call (reveal_options starts the answer timer)
+        self._llm_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="llm")
+        # Open the keep-alive connection now, while the rest of init runs
+        self._api_pool.submit(self.api.get_status)
         print(f"[INIT] ✓ Server connected")
         
         # Initialize show controller for mic pose and gestures
@@ -108,6 +141,26 @@ class NaoQuizMaster:
         )
         print(f"[INIT] ✓ Show controller ready")
         
+        # Fixed lines played via say_cached(): synthesize their wavs on the robot
+        # in the background so even the first play skips TTS
+        self.show.presynthesize([
+            f"You have {self.join_wait_time} seconds to join!",
+            "30 seconds left to join!",
+            "10 seconds! Last chance to join!",
+            "Hey co-host, think we'll get more players?",
+            "Time is up! Let's get started!",
+            "Wait, everyone got that right? I'm impressed... and suspicious.",
+            *COHOST_QUESTIONS,
+        ])
+        
+        # Silent utterance so the TTS engine's cold start doesn't delay the greeting
+        self.say_queued("\\vol=0\\ \\pau=1\\")
+        
+        # Jokes whose input never changes are generated ahead of time
+        self._joke_stock = {}
+        self._stock_joke(*SILENT_COHOST_JOKE)
+        self._stock_joke(*DIRECT_COHOST_JOKE)
+        
         # Joke rotation tracking
         # Cycles through: wrong_answer -> cohost -> audience
         self.joke_index = 0
@@ -133,6 +186,15 @@ class NaoQuizMaster:
         formatted_text = f"\\vct={pitch}\\ \\rspd={speed}\\ {text}"
         self.nao.tts.request(NaoqiTextToSpeechRequest(formatted_text), block=block)
     
+    def say_queued(self, text: str, speed: int = 90, pitch: int = 110):
+        """
+        Queue a line and return right away.
+        Queued lines are spoken back-to-back, so the next request is already
+        waiting when the current one finishes. Returns a Future; call
+        .result() where the show has to wait for the line to be spoken.
+        """
+        return self._tts_pool.submit(self.say, text, speed, pitch, True)
+    
     def say_with_gesture(self, text: str, animation: str, speed: int = 90, pitch: int = 110):
         """
         Make NAO speak and perform animation simultaneously.
@@ -148,8 +210,18 @@ class NaoQuizMaster:
         
         # Perform gesture (blocking)
         self.nao.motion.request(NaoqiAnimationRequest(animation))
+        self.show.forget_stiffness()
     
-    def say_with_mic(self, text: str, point_to_screen: bool = False, speed: int = 90, pitch: int = 110):
+    def say_cached(self, text: str, speed: int = 90, pitch: int = 110):
+        """
+        Speak a fixed line that comes back often (blocking).
+        Played from audio synthesized once on the robot; falls back to say().
+        """
+        if not self.show.say_cached(text, speed=speed, pitch=pitch):
+            self.say(text, speed=speed, pitch=pitch, block=True)
+    
+    def say_with_mic(self, text: str, point_to_screen: bool = False, speed: int = 90, pitch: int = 110,
+                     cache: bool = False):
         """
         Make NAO speak while holding mic pose.
         NOTE: Mic is held UP for the entire show (no up/down per call).
@@ -160,6 +232,7 @@ class NaoQuizMaster:
             point_to_screen: If True, point to screen with right hand
             speed: Speech speed (default 90)
             pitch: Voice pitch (default 110)
+            cache: Fixed, often repeated line - play from the TTS audio cache
         """
         # Point to screen with RIGHT arm (left arm stays in mic pose)
         if point_to_screen:
@@ -167,7 +240,10 @@ class NaoQuizMaster:
             self.show._look_screen()
         
         # Speak (blocking)
-        self.say(text, speed=speed, pitch=pitch, block=True)
+        if cache:
+            self.say_cached(text, speed=speed, pitch=pitch)
+        else:
+            self.say(text, speed=speed, pitch=pitch, block=True)
         
         # Return right arm to neutral if we pointed
         if point_to_screen:
@@ -208,8 +284,6 @@ class NaoQuizMaster:
             speed: Speech speed (default 90)
             pitch: Voice pitch (default 110)
         """
-        import threading
-        
         # Point to screen first if needed
         if point_to_screen:
             self.show._point_to_screen(duration=0.4)
@@ -292,24 +366,57 @@ class NaoQuizMaster:
         # Look at cohost and ask with mic pose
         self.show.start_face_tracking()
         print(f"[COHOST] NAO asks: {question}")
-        self.say_with_mic(question)
+        self.say_with_mic(question, cache=True)
         
         # Listen to cohost response
         cohost_response = self.listen_to_cohost()
         
         if not cohost_response:
-            # No response - generate silence joke
-            silence_joke = stream_llm_response_to_nao(self,
-                "The co-host didn't respond",
-                PROMPT_COHOST_SILENT
-            )
-            return silence_joke
+            # No response - silence joke
+            return self.say_stocked_joke(*SILENT_COHOST_JOKE)
         
         # Generate comeback using LLM
-        comeback = stream_llm_response_to_nao(self,cohost_response, PROMPT_COHOST_REACT)
+        return self.react_to_cohost(cohost_response)
+    
+    def react_to_cohost(self, cohost_response: str) -> str:
+        """
+        Speak an LLM comeback to what the cohost said.
+        The request starts right away and a short filler line covers the
+        wait for its first sentence.
         
+        Returns:
+            str: The generated comeback
+        """
+        comeback_stream = self._llm_pool.submit(open_llm_stream, cohost_response, PROMPT_COHOST_REACT)
+        filler = self.say_queued(random.choice(THINKING_FILLERS))
+        comeback = stream_llm_response_to_nao(self, cohost_response, PROMPT_COHOST_REACT,
+                                              prefetched=comeback_stream)
+        # On an error or an empty stream nothing else was queued, so the filler may still be playing
+        filler.result()
         return comeback
     
+    def _stock_joke(self, user_message: str, system_prompt: str):
+        """Start generating the next joke for this fixed input in the background."""
+        self._joke_stock[(user_message, system_prompt)] = self._llm_pool.submit(
+            get_llm_response_groq, user_message, system_prompt)
+    
+    def say_stocked_joke(self, user_message: str, system_prompt: str) -> str:
+        """
+        Speak a joke for a fixed input without waiting on the LLM.
+        Takes the joke generated in advance (waiting only if it is still on
+        its way), starts the next one, and falls back to streaming a fresh
+        joke if the stocked one failed.
+        
+        Returns:
+            str: The joke
+        """
+        stocked = self._joke_stock.get((user_message, system_prompt))
+        joke = stocked.result() if stocked is not None else None
+        self._stock_joke(user_message, system_prompt)
+        if not joke or joke.startswith("Error:"):
+            return stream_llm_response_to_nao(self, user_message, system_prompt)
+        return say_llm_text(self, joke)
+    
     def get_next_joke_type(self) -> str:
         """
         Get the next joke type in rotation.
@@ -349,11 +456,8 @@ class NaoQuizMaster:
         # Look at cohost direction
         self.show.start_face_tracking()
         
-        # Generate direct roast using LLM
-        joke = stream_llm_response_to_nao(self,
-            "Make a direct jab at the co-host",
-            PROMPT_COHOST_DIRECT
-        )
+        # Direct roast from the LLM
+        joke = self.say_stocked_joke(*DIRECT_COHOST_JOKE)
         
         # Deliver with mic pose
         print(f"[COHOST] Said: {joke}")
@@ -364,11 +468,8 @@ class NaoQuizMaster:
         """
         print("[COHOST] Cohost is silent, making joke...")
         
-        # Generate silence joke
-        joke = stream_llm_response_to_nao(self,
-            "The co-host didn't respond",
-            PROMPT_COHOST_SILENT
-        )
+        # Silence joke
+        joke = self.say_stocked_joke(*SILENT_COHOST_JOKE)
         
         print(f"[COHOST] Silent joke: {joke}")
     
@@ -426,7 +527,7 @@ class NaoQuizMaster:
             self.show._look_audience_left()
             # 4. Generate sarcastic comeback using LLM
             print("[INTRO] Generating LLM response...")
-            comeback = stream_llm_response_to_nao(self, cohost_response, PROMPT_COHOST_REACT)
+            comeback = self.react_to_cohost(cohost_response)
             
             # NAO delivers comeback with mic pose
             print(f"[INTRO] NAO says comeback: {comeback}")
@@ -467,40 +568,55 @@ class NaoQuizMaster:
         
         # 1. Instructions to join (point to screen)
         print("[PLAYERS] NAO gives instructions...")
+        # One TTS request; the pause between the two lines is spoken by NAO
         self.say_with_mic(
-            "Get your phones ready and join the game by scanning the QR code on the screen!",
+            "Get your phones ready and join the game by scanning the QR code on the screen! "
+            "\\pau=1000\\ Type in your name. Don't worry, I don't judge your username choices... much.",
             point_to_screen=True
         )
-        
-        time.sleep(1)
-        self.say_with_mic("Type in your name. Don't worry, I don't judge your username choices... much.")
         self.show._say_with_mic_walk_turn_and_gaze_internal("Actually, I want to play the quiz myself, I am going to sit in the audience!")
         self.end_mic_pose()
-        time.sleep(3)
+        self.show.wait_for_speech(timeout=3.0)
         
         # 2. Wait for players using timer
         print(f"[PLAYERS] Waiting {self.join_wait_time} seconds for players to join...")
         
         jokes_made = 0  # Track how many jokes we made
-        elapsed = 0  # Track elapsed time in seconds
         last_player_count = 0
-        poll_interval = 5  # Check every 5 seconds
+        
+        # Moments (seconds remaining) where NAO says something, done once each;
+        # marks that are not inside the join window would fire on the first poll
+        pending_marks = {
+            name: at
+            for name, at in {"30s": 30, "10s": 10, "cohost": self.join_wait_time / 2}.items()
+            if at < self.join_wait_time
+        }
         
         # Announce the timer
-        self.say_with_mic(f"You have {self.join_wait_time} seconds to join!")
+        self.say_with_mic(f"You have {self.join_wait_time} seconds to join!", cache=True)
+        deadline = time.monotonic() + self.join_wait_time
         
-        while elapsed < self.join_wait_time:
-            # Get current player status
-            status = self.api.get_status()
-            player_count = status.get("player_count", 0)
-            remaining = self.join_wait_time - elapsed
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            # Long-poll until a player joins or the next announcement is due
+            # (a mark that came due during a joke makes this a quick poll)
+            next_mark = max(pending_marks.values(), default=0)
+            wait = max(0.0, min(remaining - next_mark, LOBBY_POLL_TIMEOUT))
+            # (KahootAPI backs off by itself while the server is unreachable)
+            lobby = self.api.wait_for_player_change(last_player_count, timeout=wait)
             
-            print(f"[PLAYERS] Players: {player_count} | Time remaining: {remaining}s")
+            player_count = lobby.get("player_count", last_player_count)
+            remaining = deadline - time.monotonic()
+            
+            log.debug("[PLAYERS] Players: %d | Time remaining: %.0fs", player_count, remaining)
             
             # New player joined - make a joke about their name
             if player_count > last_player_count and player_count > 0:
                 print("[PLAYERS] New player joined! Making joke...")
-                player_names = self.api.get_players()
+                player_names = lobby.get("players", [])
                 
                 if player_names:
                     # Get the newest player (last in list)
@@ -510,34 +626,33 @@ class NaoQuizMaster:
                         PROMPT_PLAYER_NAMES
                     )
                     jokes_made += 1
-                
-                last_player_count = player_count
+            
+            last_player_count = player_count
             
             # Time announcements at key moments
-            if remaining == 30:
-                self.say_with_mic("30 seconds left to join!")
-            elif remaining == 10:
-                self.say_with_mic("10 seconds! Last chance to join!")
+            if "30s" in pending_marks and remaining <= pending_marks["30s"]:
+                del pending_marks["30s"]
+                self.say_with_mic("30 seconds left to join!", cache=True)
+            elif "10s" in pending_marks and remaining <= pending_marks["10s"]:
+                del pending_marks["10s"]
+                self.say_with_mic("10 seconds! Last chance to join!", cache=True)
             
             # Cohost interaction at the halfway point (once)
-            if elapsed == 30:
+            if "cohost" in pending_marks and remaining <= pending_marks["cohost"]:
+                del pending_marks["cohost"]
                 print("[PLAYERS] Halfway point, talking to cohost...")
                 self.show.start_face_tracking()
-                self.say_with_mic("Hey co-host, think we'll get more players?")
+                self.say_with_mic("Hey co-host, think we'll get more players?", cache=True)
                 
                 response = self.listen_to_cohost()
                 if response:
-                    comeback = stream_llm_response_to_nao(self, response, PROMPT_COHOST_REACT)
+                    comeback = self.react_to_cohost(response)
                 else:
                     self.joke_about_silent_cohost()
-            
-            # Wait before checking again
-            time.sleep(poll_interval)
-            elapsed += poll_interval
         
         # Timer finished - start the quiz
         print(f"[PLAYERS] Timer done! {last_player_count} players joined.")
-        self.say_with_mic("Time is up! Let's get started!")
+        self.say_with_mic("Time is up! Let's get started!", cache=True)
         
         # Quick cohost jab before starting - no response needed
         self.show.start_face_tracking()
@@ -562,15 +677,14 @@ class NaoQuizMaster:
         print("PHASE: QUIZ LOOP")
         print("="*60)
         
-        # Start the quiz on the server
+        # Start the quiz on the server while NAO talks
+        # (the response carries the initial status, incl. total questions)
         print("[QUIZ] Starting quiz...")
-        self.api.start_quiz()
-        
+        start_future = self._api_pool.submit(self.api.start_quiz)
         self.say_with_mic("Alright! Let's begin. Get ready... focus... okay maybe a little pressure.")
         time.sleep(1)
         
-        # Get initial status to know total questions
-        status = self.api.get_status()
+        status = start_future.result() or self.api.get_status()
         total_questions = status.get("total_questions", 5)
         
         print(f"[QUIZ] Total questions: {total_questions}")
@@ -582,9 +696,11 @@ class NaoQuizMaster:
         while not quiz_finished:
             print(f"\n--- QUESTION {question_num}/{total_questions} ---")
             
-            # Get current question from status
+            # Current question comes with the status from start / next_question;
+            # only fetch it separately if that call failed
             # Note: "current_question" is the index (int), "current_question_data" is the dict
-            status = self.api.get_status()
+            if not status.get("current_question_data"):
+                status = self.api.get_session()
             current_question = status.get("current_question_data", {})
             
             # Check if quiz is finished
@@ -597,21 +713,28 @@ class NaoQuizMaster:
             question_text = current_question.get("text", f"Question {question_num}")
             print(f"[QUIZ] Question: {question_text}")
             
-            # Point to screen while reading question
-            self.say_with_mic(f"Question {question_num}. {question_text}", point_to_screen=True)
-            
-            time.sleep(1)
+            # Queue question + options together so NAO goes straight from one
+            # to the other (the 1s pause is spoken as a TTS pause instead of a sleep)
+            options = current_question.get("options", [])
+            self.show._point_to_screen(duration=0.4)
+            self.show._look_screen()
+            question_done = self.say_queued(f"Question {question_num}. {question_text}")
+            options_done = None
+            if options:
+                options_text = OPTION_SEPARATOR.join(prefix + opt for prefix, opt in zip(OPTION_PREFIXES, options))
+                options_done = self.say_queued("\\pau=1000\\ " + options_text)
+            question_done.result()
             
             # 2. Reveal options (this starts the timer on the server)
+            # Sent in the background while NAO reads the options
             print("[QUIZ] Revealing options...")
-            self.api.reveal_options()
+            reveal_future = self._api_pool.submit(self.api.reveal_options)
             
-            # Read options aloud with mic pose
-            options = current_question.get("options", [])
-            if options:
-                options_text = ". ".join([f"{chr(65+i)}, {opt}" for i, opt in enumerate(options)])
-                self.say_with_mic(options_text, point_to_screen=True)
+            if options_done:
+                options_done.result()
+            self.show._arm_neutral(duration=0.3)
             
+            reveal_future.result()
             
             # 3. Wait for answers (poll until time's up or all answered)
             print("[QUIZ] Waiting for answers...")
@@ -622,6 +745,12 @@ class NaoQuizMaster:
             result = self.api.show_answers()
             
             if result:
+                # Send the wrong-answer joke request now so the LLM works while NAO reveals the answer
+                wrong_message = self._wrong_answer_message(result)
+                wrong_joke = None
+                if wrong_message and question_num != 4:
+                    wrong_joke = self._llm_pool.submit(open_llm_stream, wrong_message, PROMPT_WRONG_ANSWER_TRANSITION)
+                
                 # Use letter + text for readable answer (e.g., "A, Amsterdam")
                 letter = result.get("correct_answer_letter", "A")
                 text = result.get("correct_answer_text", "")
@@ -632,25 +761,24 @@ class NaoQuizMaster:
                 if question_num == 4:
                     self.show._say_with_mic_walk_turn_and_gaze_internal("So you guys do not think I am funny? I am leaving!")
                     self.end_mic_pose()
-                    time.sleep(3)
+                    self.show.wait_for_speech(timeout=3.0)
                 else:
-                    self._do_joke_for_question(result)
-            
-            time.sleep(1)
+                    self._do_joke_for_question(result, wrong_joke)
+                    time.sleep(1)
             
             # 6. Show leaderboard
             print("[QUIZ] Showing leaderboard...")
             leaderboard = self.api.show_leaderboard()
             
-            if leaderboard and len(leaderboard) > 0:
-                leader = leaderboard[0]
-                self.say_with_mic(f"In the lead: {leader['name']} with {leader['score']} points!", point_to_screen=True)
+            if leaderboard:
+                names, scores = self._unpack_leaderboard(leaderboard)
+                self.say_with_mic(f"In the lead: {names[0]} with {scores[0]} points!", point_to_screen=True)
             
             time.sleep(2)
             
-            # Move to next question
+            # Move to next question (returns the new status for the next round)
             print("[QUIZ] Moving to next question...")
-            next_result = self.api.next_question()
+            status = self.api.next_question()
             
             # Check if we've completed all questions
             # (question_num starts at 1, so after question 5 we're done with 5 total)
@@ -661,40 +789,68 @@ class NaoQuizMaster:
         
         print("[QUIZ] ✓ Quiz loop complete\n")
     
-    def _wait_for_answers(self, timeout: int = 10, poll_interval: int = 2):
+    def _wait_for_answers(self, timeout: int = 10):
         """
-        Wait for all players to answer or timeout (max 30 sec).
+        Wait for all players to answer or timeout.
         After timeout, moves on even if not everyone answered.
+        Uses a server long-poll that returns as soon as someone answers,
+        so the last answer ends the wait immediately.
         
         Args:
-            timeout: Max seconds to wait (default 30)
-            poll_interval: Seconds between checks (default 2)
+            timeout: Max seconds to wait (default 10)
         """
         print(f"[QUIZ] Waiting for answers (max {timeout}s)...")
-        elapsed = 0
+        deadline = time.monotonic() + timeout
+        answered = 0
         
-        while elapsed < timeout:
-            results = self.api.get_results()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             
-            if results:
-                answered = results.get("answered_count", 0)
-                total = results.get("total_players", 1)
-                remaining = timeout - elapsed
+            session = self.api.wait_for_answer_change(answered, timeout=remaining)
+            
+            if session:
+                answered = session.get("answered_count", 0)
+                total = session.get("player_count", 1)
                 
-                print(f"[QUIZ] Answers: {answered}/{total} ({remaining}s left)")
+                log.debug("[QUIZ] Answers: %d/%d (%.0fs left)", answered, total, deadline - time.monotonic())
                 
                 # All players answered - done early
                 if answered >= total:
                     print("[QUIZ] ✓ All players answered!")
                     return
-            
-            time.sleep(poll_interval)
-            elapsed += poll_interval
+            else:
+                # Request failed - don't spin on the error
+                time.sleep(max(0.0, min(ANSWER_RETRY_DELAY, deadline - time.monotonic())))
         
         # Timeout reached - move on anyway
         print(f"[QUIZ] ⏱ Timeout ({timeout}s) - moving on")
     
-    def _do_joke_for_question(self, result: dict):
+    @staticmethod
+    def _unpack_leaderboard(leaderboard: list) -> tuple:
+        """
+        Split the leaderboard into parallel name and score lists.
+        
+        Args:
+            leaderboard: Leaderboard entries from the show_leaderboard API
+        
+        Returns:
+            tuple: (names, scores), both in leaderboard order
+        """
+        names = [entry.get("name", "Unknown") for entry in leaderboard]
+        scores = [entry.get("score", 0) for entry in leaderboard]
+        return names, scores
+    
+    @staticmethod
+    def _wrong_answer_message(result: dict):
+        """LLM input for the wrong-answer joke, or None when everyone was right."""
+        wrong_players = result.get("wrong_players", [])
+        if not wrong_players:
+            return None
+        return f"Players who got it wrong: {', '.join(wrong_players[:3])}"
+    
+    def _do_joke_for_question(self, result: dict, wrong_joke=None):
         """
         Make jokes during answer reveal transition.
         
@@ -704,23 +860,24 @@ class NaoQuizMaster:
         
         Args:
             result: The answer result from show_answers API
+            wrong_joke: Optional Future of the already sent wrong-answer joke stream
         """
         # 1. ALWAYS joke about wrong answer players first
-        wrong_players = result.get("wrong_players", [])
+        wrong_message = self._wrong_answer_message(result)
         
-        if wrong_players:
+        if wrong_message:
             print("[JOKE] Making joke about wrong answer players...")
-            names_str = ", ".join(wrong_players[:3])
             
             # Use the transition-specific prompt for wrong answers
             joke = stream_llm_response_to_nao(self,
-                f"Players who got it wrong: {names_str}",
-                PROMPT_WRONG_ANSWER_TRANSITION
+                wrong_message,
+                PROMPT_WRONG_ANSWER_TRANSITION,
+                prefetched=wrong_joke
             )
             time.sleep(1)
         else:
             # Everyone got it right - be impressed
-            self.say_with_mic("Wait, everyone got that right? I'm impressed... and suspicious.")
+            self.say_with_mic("Wait, everyone got that right? I'm impressed... and suspicious.", cache=True)
             time.sleep(1)
         
         # 2. Rotating interaction: cohost or audience
@@ -757,10 +914,12 @@ class NaoQuizMaster:
         # Get final leaderboard
         leaderboard = self.api.show_leaderboard()
         
-        if not leaderboard or len(leaderboard) == 0:
+        if not leaderboard:
             self.say_with_mic("Well, that was fun! Thanks for playing!")
             return
         
+        names, scores = self._unpack_leaderboard(leaderboard)
+        
         # 1. Build tension
         print("[FINALE] Building tension...")
         self.say_with_mic("Alright everyone... the moment you've been waiting for...")
@@ -770,9 +929,7 @@ class NaoQuizMaster:
         time.sleep(1)
         
         # 2. Announce winner
-        winner = leaderboard[0]
-        winner_name = winner.get("name", "Unknown")
-        winner_score = winner.get("score", 0)
+        winner_name, winner_score = names[0], scores[0]
         
         print(f"[FINALE] Winner: {winner_name} with {winner_score} points")
         
@@ -784,9 +941,8 @@ class NaoQuizMaster:
             animation="animations/Stand/Gestures/Enthusiastic_4"
         )
         
-        time.sleep(1)
-        
         # Then generate and speak winner joke AFTER announcing
+        # (no extra sleep: waiting for the LLM's first sentence is already a pause)
         # Note: make_joke() speaks the joke via stream_llm_response_to_nao
         winner_context = f"Winner is {winner_name} with {winner_score} points"
         self.make_joke("winner", winner_context)
@@ -794,10 +950,8 @@ class NaoQuizMaster:
         time.sleep(1)
         
         # 3. Announce loser (if more than 1 player)
-        if len(leaderboard) > 1:
-            loser = leaderboard[-1]
-            loser_name = loser.get("name", "Unknown")
-            loser_score = loser.get("score", 0)
+        if len(names) > 1:
+            loser_name, loser_score = names[-1], scores[-1]
             
             print(f"[FINALE] Loser: {loser_name} with {loser_score} points")
             
@@ -823,7 +977,7 @@ class NaoQuizMaster:
         
         if cohost_response:
             # React to cohost
-            comeback = stream_llm_response_to_nao(self, cohost_response, PROMPT_COHOST_REACT)
+            comeback = self.react_to_cohost(cohost_response)
         else:
             # Cohost didn't respond - make a joke about it
             self.joke_about_silent_cohost()
@@ -861,11 +1015,15 @@ class NaoQuizMaster:
         print("="*60)
         
         try:
-            # Wake up NAO and stand
+            # Wake up NAO and stand; meanwhile load what later phases need
             print("\n[SETUP] Waking up NAO...")
-            self.nao.autonomous.request(NaoWakeUpRequest())
-            self.nao.motion.request(NaoPostureRequest("Stand", 0.7))
-            time.sleep(2)
+            # The LLM warm-up is a network call: never let the intro wait on it
+            threading.Thread(target=warm_up_llm, name="llm-warm-up", daemon=True).start()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="warm-up") as warm_up:
+                warm_up.submit(self.show._load_mic_recordings)
+                self.nao.autonomous.request(NaoWakeUpRequest())
+                self.nao.motion.request(NaoPostureRequest("Stand", 0.7))
+                self.show.forget_stiffness()
             
             # NOTE: Mic pose starts INSIDE phase_intro() after the Hey gesture
             # (gestures cancel arm positions, so we do mic pose after)
@@ -898,10 +1056,13 @@ class NaoQuizMaster:
             
             # Put NAO to rest
             print("[CLEANUP] Putting NAO to rest...")
-            try:
-                self.nao.autonomous.request(NaoRestRequest())
-            except:
-                pass
+            self.show.go_to_rest()
+            
+            self.show.shutdown()
+            self._api_pool.shutdown(wait=False)
+            self._llm_pool.shutdown(wait=False, cancel_futures=True)
+            self._tts_pool.shutdown(wait=False, cancel_futures=True)
+            self.api.close()
             
             print("[CLEANUP] Done.\n")
 
@@ -913,6 +1074,8 @@ class NaoQuizMaster:
 def main():
     """Entry point for NAO quiz host script."""
     
+    setup_logging()
+    
     print("\n" + "="*60)
     print("NAO QUIZ HOST - CONFIGURATION")
     print("="*60)
@@ -920,6 +1083,8 @@ def main():
     print(f"Server URL:      {SERVER_URL}")
     print(f"Google Key:      {GOOGLE_KEY}")
     print(f"Join Wait Time:  {JOIN_WAIT_TIME}s")
+    # .env is loaded once when speech.llm is imported; check it before NAO connects
+    print(f"Groq API Key:    {'set' if environ.get('GROQ_API_KEY') else 'MISSING - LLM jokes will fail'}")
     print("="*60 + "\n")
     
     # Create quiz master and run
@@ -930,7 +1095,10 @@ def main():
         join_wait_time=JOIN_WAIT_TIME
     )
     
-    quiz_master.run()
+    try:
+        quiz_master.run()
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -116,6 +116,16 @@ COHOST_QUESTIONS = [
     "Co-host, ready for the next one?",
 ]
 
+# Short lines NAO says right after the cohost answers, so there is no dead
+# air while the comeback is being generated
+THINKING_FILLERS = [
+    "Hmm.",
+    "Oh really?",
+    "Hmm, let me think.",
+    "Interesting.",
+    "Wow, okay.",
+]
+
 # Direct roast aimed at cohost - calls them "co-host" explicitly
 PROMPT_COHOST_DIRECT = BASE_PERSONA + """
 
@@ -0,0 +1,62 @@
+"""
+Shared qi Session
+=================
+One qi.Session per NAO for every helper that talks to NAOqi directly,
+plus cached service proxies (ALMotion, ALMemory, ...).
+
+Usage:
+    from robot.qi_session import get_service
+
+    motion = get_service(nao_ip, "ALMotion")
+"""
+
+import threading
+
+try:
+    import qi
+except ImportError:
+    qi = None
+
+
+_sessions = {}   # nao_ip -> connected qi.Session
+_services = {}   # (nao_ip, service name) -> service proxy
+_lock = threading.RLock()
+
+
+def get_session(nao_ip: str):
+    """Get the connected qi.Session for nao_ip, connecting on first use."""
+    if qi is None:
+        raise RuntimeError("qi module not available")
+    with _lock:
+        session = _sessions.get(nao_ip)
+        if session is None:
+            session = qi.Session()
+            session.connect(f"tcp://{nao_ip}:9559")
+            _sessions[nao_ip] = session
+        return session
+
+
+def preconnect(nao_ip: str, names=()) -> bool:
+    """
+    Connect the session and fetch the given service proxies ahead of time,
+    e.g. in a background thread while other startup work runs.
+    Errors are swallowed: the real get_service() call reports them later.
+    """
+    try:
+        get_session(nao_ip)
+        for name in names:
+            get_service(nao_ip, name)
+        return True
+    except Exception:
+        return False
+
+
+def get_service(nao_ip: str, name: str):
+    """Get a (cached) NAOqi service proxy on the shared session."""
+    with _lock:
+        key = (nao_ip, name)
+        service = _services.get(key)
+        if service is None:
+            service = get_session(nao_ip).service(name)
+            _services[key] = service
+        return service
@@ -31,9 +31,13 @@ Usage from main:
 """
 
 import os
+import hashlib
 import time
 import math
+import queue
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from sic_framework.devices import Nao
 from sic_framework.devices.common_naoqi.naoqi_text_to_speech import (
@@ -45,7 +49,6 @@ from sic_framework.devices.common_naoqi.naoqi_motion import (
 )
 from sic_framework.devices.common_naoqi.naoqi_motion_recorder import (
     NaoqiMotionRecording,
-    PlayRecording,
 )
 from sic_framework.devices.common_naoqi.naoqi_stiffness import Stiffness
 from sic_framework.devices.common_naoqi.naoqi_tracker import (
@@ -53,6 +56,8 @@ from sic_framework.devices.common_naoqi.naoqi_tracker import (
     RemoveTargetRequest,
 )
 
+from robot.qi_session import get_session, get_service
+
 
 try:
     import qi
@@ -60,6 +65,20 @@ except ImportError:
     qi = None
 
 
+_PI      = math.pi
+_HALF_PI = math.pi / 2.0
+_TWO_PI  = 2.0 * math.pi
+
+
+def _wrap_pi(angle: float) -> float:
+    """Wrap an angle to [-pi, pi) with a modulo instead of atan2(sin, cos)."""
+    return (angle + _PI) % _TWO_PI - _PI
+
+
+# Hot-path output (gaze ticks, walk phases) goes through logging at DEBUG level
+log = logging.getLogger("nao.show")
+
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(BASE_DIR)))
 RECORDINGS_DIR = os.path.join(PROJECT_ROOT, "demos", "nao")
@@ -78,13 +97,42 @@ AUDIENCE_LEFT_PITCH = 0.0
 AUDIENCE_RIGHT_YAW   = 0.259
 AUDIENCE_RIGHT_PITCH = 0.0
 
+# World-frame yaw per gaze target (compensated for heading once per turn)
+GAZE_BASE_YAWS = {
+    "audience_left":  AUDIENCE_LEFT_YAW,
+    "audience_right": AUDIENCE_RIGHT_YAW,
+    "screen":         SCREEN_YAW,
+}
+
+# --- Arm poses (joint names + angles in rad), built once ---
+# Never mutated: passed straight to angleInterpolation
+MIC_JOINTS = ["LShoulderPitch", "LShoulderRoll", "LElbowYaw", "LElbowRoll", "LWristYaw"]
+# Simple mic pose: arm a bit forward, slightly out, forearm across body, elbow bent
+MIC_UP_ANGLES = [0.5, 0.25, -1.2, -1.0, 0.0]
+# Neutral-ish standing arm pose
+MIC_DOWN_ANGLES = [1.4, 0.15, -1.2, -0.5, 0.0]
+
+POINT_JOINTS = ["RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll"]
+# Pointing forward-right toward the screen: shoulder up, out, elbow extended
+POINT_ANGLES = [0.3, -0.3, 1.0, 0.3]
+# Relaxed at side
+POINT_NEUTRAL_ANGLES = [1.4, -0.15, 1.2, 0.5]
+
 
 # Walking / pacing parameters
 STRAIGHT_STEP          = 1.0   # meters along the stage
 GAZE_STEP_DT           = 0.8
-HEAD_MOVE_TIME         = 0.8
+HEAD_MOVE_SPEED        = 0.15  # fraction of max speed for gaze head moves
+COUNTDOWN_STEP         = 1.0   # seconds per number in the landing countdown
+PANIC_WAIT_MS          = 5000  # max wait for the panic line before counting down
 FORWARD_PHASE_DURATION = 6.0  # rough time for 1m + gaze
 
+# NAOqi services used through the shared qi session
+QI_SERVICES = ("ALMotion", "ALMemory", "ALLeds", "ALTextToSpeech", "ALAudioPlayer")
+
+# Pre-synthesized lines are stored on the robot as /tmp/nao_tts_<sha1>.wav
+TTS_CACHE_PREFIX = "/tmp/nao_tts_"
+
 
 class NaoShowController(object):
     """
@@ -95,6 +143,9 @@ class NaoShowController(object):
     - airborne panic
     """
 
+    # Parsed motion recordings by path, shared by all controller instances
+    _REC_CACHE = {}
+
     def __init__(
         self,
         nao: Nao,
@@ -106,12 +157,10 @@ class NaoShowController(object):
         self.nao_ip = nao_ip
         self.test_mode = test_mode
 
-        # Motion recorder recordings
-        self.mic_up_recording = None
-        self.mic_down_recording = None
-
-        # Robot heading in world frame
+        # Robot heading in world frame + head yaw per gaze target for that heading
         self.heading = 0.0
+        self._compensated_yaw = {}
+        self._set_heading(0.0)
 
         # qi / NAOqi services
         self.qi_session = None
@@ -119,15 +168,30 @@ class NaoShowController(object):
         self.memory_service = None
         self.leds_service = None
         self.tts_service = None
+        self.audio_service = None
+        self._tts_files = set()    # cache keys already synthesized to a wav on the robot
+        self._tts_pending = set()  # cache keys queued for synthesis
 
         # Threading
-        self._walk_thread = None
+        self._pending_walk = None  # latest (straight, side, curve) not yet sent
+        self._walk_lock = threading.Lock()
         self._airborne_thread = None
+        self._foot_contact_sub = None   # ALMemory subscriber (kept alive while monitoring)
+        self._foot_contact_link = None
+        self._last_foot_state = None
         self._stop_airborne_monitor = False
         self._airborne_state = False
-        self._airborne_handling = False
+        self._airborne_handled_until = 0.0  # monotonic time; ignore new lift-offs until then
         self._ground_countdown_running = False
-        self._ground_thread = None
+        self._phase_stop = threading.Event()  # set while airborne, wakes gaze/walk waits
+
+        # Long-lived workers, each running (fn, args) jobs from its own queue in order
+        self._speech_q = self._start_worker("nao-speech")  # show texts, one request each
+        self._voice_q  = self._start_worker("nao-voice")   # landing countdown
+        self._panic_future = None  # qi.Future of the panic line being spoken
+        self._motion_q = self._start_worker("nao-motion")  # blocking walk fallback
+        self._event_q  = self._start_worker("nao-events")  # airborne handling
+        self._tts_cache_q = self._start_worker("nao-tts-cache")  # wav synthesis for say_cached
 
         # Airborne events
         self._airborne_events = 0
@@ -135,9 +199,16 @@ class NaoShowController(object):
 
         self._active_targets = set()
 
+        # Gaze patterns per walking direction, built once (used every gaze tick).
+        # Length must stay a power of two: the tick index is masked, not modded.
+        self._gaze_pattern_pos = (self._look_audience_left, self._look_audience_right)
+        self._gaze_pattern_neg = (self._look_audience_right, self._look_audience_left)
+        self._gaze_mask = len(self._gaze_pattern_pos) - 1
+        self._head_stiff_set = False  # Head stiffness only needs one RPC until rest
+        self._arm_stiff_set = set()   # arm chains whose stiffness is already on (until rest)
+
         if not self.test_mode:
             self._setup_qi()
-            self._load_recordings()
         else:
             print("[NaoShowController] TEST_MODE: no qi / recordings")
 
@@ -156,6 +227,7 @@ class NaoShowController(object):
             from sic_framework.devices.common_naoqi.naoqi_autonomous import NaoWakeUpRequest
             self.nao.autonomous.request(NaoWakeUpRequest())
             self.nao.motion.request(NaoPostureRequest(posture, speed))
+            self.forget_stiffness()
             time.sleep(2.0)
         except Exception as e:
             print(f"[NaoShowController] ERROR in wake_and_stand: {e}")
@@ -187,78 +259,155 @@ class NaoShowController(object):
         try:
             from sic_framework.devices.common_naoqi.naoqi_autonomous import NaoRestRequest
             self.nao.autonomous.request(NaoRestRequest())
+            self.forget_stiffness()
         except Exception as e:
             print(f"[NaoShowController] ERROR in go_to_rest: {e}")
 
+    def forget_stiffness(self):
+        """
+        Call after anything outside this controller may have changed joint
+        stiffness (rest, wake-up, postures, animations): the next head or
+        arm move sets it again.
+        """
+        self._head_stiff_set = False
+        self._arm_stiff_set.clear()
+
     def start_airborne_monitor(self):
-        """Start footContact monitor in background."""
+        """
+        Start footContact monitor.
+        Uses the footContactChanged event (push, no polling); falls back to a
+        polling thread if the subscription fails.
+        """
         if self.test_mode or self.memory_service is None:
             print("[NaoShowController] start_airborne_monitor(): disabled")
             return
-        if self._airborne_thread is not None:
+        if self._airborne_thread is not None or self._foot_contact_sub is not None:
             return
         self._stop_airborne_monitor = False
+        self._last_foot_state = None
+
+        try:
+            self._foot_contact_sub = self.memory_service.subscriber("footContactChanged")
+            self._foot_contact_link = self._foot_contact_sub.signal.connect(self._on_foot_contact)
+            print("[NaoShowController] Airborne monitor subscribed to footContactChanged")
+            # Events only fire on change, so seed with the current state
+            self._on_foot_contact(self.memory_service.getData("footContact"))
+            return
+        except Exception as e:
+            print(f"[NaoShowController] WARNING: footContactChanged subscribe failed ({e}), polling instead")
+            self._foot_contact_sub = None
+
         self._airborne_thread = threading.Thread(
             target=self._airborne_monitor_loop,
             daemon=True,
         )
         self._airborne_thread.start()
 
+    def shutdown(self):
+        """Stop the airborne monitor and the worker threads."""
+        self.stop_airborne_monitor()
+        for q in (self._speech_q, self._voice_q, self._motion_q, self._event_q, self._tts_cache_q):
+            q.put(None)
+
     def stop_airborne_monitor(self):
-        """Stop the background airborne monitor."""
+        """Stop the airborne monitor (event subscription or polling thread)."""
         self._stop_airborne_monitor = True
         self._airborne_thread = None
+        if self._foot_contact_sub is not None:
+            try:
+                self._foot_contact_sub.signal.disconnect(self._foot_contact_link)
+            except Exception as e:
+                print(f"[NaoShowController] ERROR disconnecting footContactChanged: {e}")
+            self._foot_contact_sub = None
+            print("[NaoShowController] Airborne monitor stopped")
 
     # ------------------------------------------------------------------
     # Setup
     # ------------------------------------------------------------------
+    def _start_worker(self, name: str) -> queue.Queue:
+        """Start a daemon worker thread and return its job queue."""
+        q = queue.Queue()
+        threading.Thread(target=self._worker_loop, args=(q,), name=name, daemon=True).start()
+        return q
+
+    @staticmethod
+    def _worker_loop(q: queue.Queue):
+        while True:
+            job = q.get()
+            if job is None:  # shutdown
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[NaoShowController] ERROR in {fn.__name__}: {e}")
+
     def _setup_qi(self):
         if qi is None:
             print("[NaoShowController] qi module not available; no ALMotion/ALMemory/ALLeds/TTS.")
             return
         try:
-            print(f"[NaoShowController] Connecting qi.Session to tcp://{self.nao_ip}:9559 ...")
-            self.qi_session = qi.Session()
-            self.qi_session.connect(f"tcp://{self.nao_ip}:9559")
+            print(f"[NaoShowController] Using shared qi.Session to tcp://{self.nao_ip}:9559 ...")
+            self.qi_session = get_session(self.nao_ip)
 
-            self.motion_service = self.qi_session.service("ALMotion")
-            self.memory_service = self.qi_session.service("ALMemory")
-            self.leds_service   = self.qi_session.service("ALLeds")
-            self.tts_service    = self.qi_session.service("ALTextToSpeech")
+            # (keep in sync with QI_SERVICES, which main.py preconnects)
+            self.motion_service = get_service(self.nao_ip, "ALMotion")
+            self.memory_service = get_service(self.nao_ip, "ALMemory")
+            self.leds_service   = get_service(self.nao_ip, "ALLeds")
+            self.tts_service    = get_service(self.nao_ip, "ALTextToSpeech")
+            self.audio_service  = get_service(self.nao_ip, "ALAudioPlayer")
 
-            print("[NaoShowController] Connected to ALMotion, ALMemory, ALLeds, ALTextToSpeech")
+            print("[NaoShowController] Connected to ALMotion, ALMemory, ALLeds, ALTextToSpeech, ALAudioPlayer")
         except Exception as e:
             print(f"[NaoShowController] WARNING: Could not create qi Session / services: {e}")
             self.motion_service = None
             self.memory_service = None
             self.leds_service   = None
             self.tts_service    = None
+            self.audio_service  = None
 
-    def _load_recordings(self):
-        print(f"[NaoShowController] Loading mic_up from {MIC_UP_PATH}")
-        try:
-            self.mic_up_recording = NaoqiMotionRecording.load(MIC_UP_PATH)
-            print("[NaoShowController] Loaded mic_up recording")
-        except Exception as e:
-            print(f"[NaoShowController] Could not load mic_up: {e}")
-
-        print(f"[NaoShowController] Loading mic_down from {MIC_DOWN_PATH}")
+    def _load_recording(self, name: str, path: str):
+        """Load a motion recording on first use; parsed recordings are shared per path."""
+        if self.test_mode:
+            return None
+        if path in self._REC_CACHE:
+            return self._REC_CACHE[path]
+        print(f"[NaoShowController] Loading {name} from {path}")
         try:
-            self.mic_down_recording = NaoqiMotionRecording.load(MIC_DOWN_PATH)
-            print("[NaoShowController] Loaded mic_down recording")
+            recording = NaoqiMotionRecording.load(path)
+            print(f"[NaoShowController] Loaded {name} recording")
         except Exception as e:
-            print(f"[NaoShowController] Could not load mic_down: {e}")
+            print(f"[NaoShowController] Could not load {name}: {e}")
+            return None
+        self._REC_CACHE[path] = recording
+        return recording
+
+    @property
+    def mic_up_recording(self):
+        return self._load_recording("mic_up", MIC_UP_PATH)
+
+    @property
+    def mic_down_recording(self):
+        return self._load_recording("mic_down", MIC_DOWN_PATH)
+
+    def _load_mic_recordings(self):
+        """Get (mic_up, mic_down); on first use both files are read concurrently."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            mic_up = pool.submit(self._load_recording, "mic_up", MIC_UP_PATH)
+            mic_down = pool.submit(self._load_recording, "mic_down", MIC_DOWN_PATH)
+            return mic_up.result(), mic_down.result()
 
     # ------------------------------------------------------------------
     # LEDs, TTS for panic
     # ------------------------------------------------------------------
     def _set_face_color(self, r: int, g: int, b: int, duration: float = 0.2):
+        """Fade the face LEDs without waiting: the fade runs alongside the next speech."""
         if self.test_mode or self.leds_service is None:
             print(f"[NaoShowController] set_face_color({r}, {g}, {b}) (no ALLeds)")
             return
         try:
             rgb = (r << 16) | (g << 8) | b
-            self.leds_service.fadeRGB("FaceLeds", rgb, duration)
+            self.leds_service.fadeRGB("FaceLeds", rgb, duration, _async=True)
         except Exception as e:
             print(f"[NaoShowController] ERROR in set_face_color: {e}")
 
@@ -269,6 +418,9 @@ class NaoShowController(object):
         try:
             print("[NaoShowController] Stopping all speech via ALTextToSpeech.stopAll()")
             self.tts_service.stopAll()
+            if self._panic_future is not None:
+                self._panic_future.cancel()
+                self._panic_future = None
         except Exception as e:
             print(f"[NaoShowController] ERROR in stop_all_speech: {e}")
 
@@ -278,12 +430,11 @@ class NaoShowController(object):
         if self.test_mode:
             return
         if self.tts_service is not None:
-            def _panic_thread():
-                try:
-                    self.tts_service.say(panic_text)
-                except Exception as e:
-                    print(f"[NaoShowController] ERROR in panic say: {e}")
-            threading.Thread(target=_panic_thread, daemon=True).start()
+            # qi runs the call on its own thread pool; keep the future to wait/cancel
+            try:
+                self._panic_future = self.tts_service.say(panic_text, _async=True)
+            except Exception as e:
+                print(f"[NaoShowController] ERROR in panic say: {e}")
         else:
             if not self.nao:
                 return
@@ -310,23 +461,116 @@ class NaoShowController(object):
         except Exception as e:
             print(f"[NaoShowController] ERROR in fallback say_slow_blocking: {e}")
 
+    def say_cached(self, text: str, speed: int = 90, pitch: int = 110) -> bool:
+        """
+        Speak a repeated line from a wav synthesized once on the robot (blocking).
+        Returns False when ALTextToSpeech/ALAudioPlayer are unavailable or the
+        wav is not ready yet (it is then synthesized in the background for next
+        time), so the caller can fall back to normal TTS.
+        """
+        if self.test_mode or self.tts_service is None or self.audio_service is None:
+            return False
+        markup_text, key, path = self._tts_cache_entry(text, speed, pitch)
+        if key not in self._tts_files:
+            self._queue_tts_file(markup_text, key, path)
+            return False
+        try:
+            self.audio_service.playFile(path)
+            return True
+        except Exception as e:
+            print(f"[NaoShowController] ERROR in say_cached: {e}")
+            return False
+
+    def presynthesize(self, lines, speed: int = 90, pitch: int = 110):
+        """Queue wav synthesis of lines that say_cached() will play later (non-blocking)."""
+        if self.test_mode or self.tts_service is None:
+            return
+        for text in lines:
+            self._queue_tts_file(*self._tts_cache_entry(text, speed, pitch))
+
+    @staticmethod
+    def _tts_cache_entry(text: str, speed: int, pitch: int):
+        """(markup text, cache key, wav path on the robot) for a cached line."""
+        markup_text = f"\\vct={pitch}\\ \\rspd={speed}\\ {text}"
+        key = hashlib.sha1(markup_text.encode("utf-8")).hexdigest()
+        return markup_text, key, f"{TTS_CACHE_PREFIX}{key}.wav"
+
+    def _queue_tts_file(self, markup_text: str, key: str, path: str):
+        if key in self._tts_files or key in self._tts_pending:
+            return
+        self._tts_pending.add(key)
+        self._tts_cache_q.put((self._write_tts_file, (markup_text, key, path)))
+
+    def _write_tts_file(self, markup_text: str, key: str, path: str):
+        """TTS cache worker job: synthesize one line to a wav on the robot."""
+        try:
+            self.tts_service.sayToFile(markup_text, path)
+            self._tts_files.add(key)
+        except Exception as e:
+            print(f"[NaoShowController] ERROR synthesizing cached line: {e}")
+        finally:
+            self._tts_pending.discard(key)
+
     def _say_async(self, text: str):
-        slow_text = "\\rspd=80\\ " + text
         print(f"[NAO SAYS ASYNC, SLOW] {text[:60]}...")
         if self.test_mode or not self.nao:
             return
+        self._speech_q.put((self._speak_text, ("\\rspd=80\\ " + text,)))
+
+    def _speak_text(self, slow_text: str):
+        """
+        Speech worker job: the whole text as one blocking request, so there is
+        no round-trip gap between sentences (skipped while airborne; stopAll
+        interrupts it mid-text).
+        """
+        if self._airborne_state:
+            return
         try:
-            self.nao.tts.request(NaoqiTextToSpeechRequest(slow_text), block=False)
+            self.nao.tts.request(NaoqiTextToSpeechRequest(slow_text), block=True)
         except Exception as e:
             print(f"[NaoShowController] ERROR in say_async: {e}")
 
+    def _clear_speech_queue(self):
+        """Drop texts that have not been spoken yet; wait_for_speech markers and shutdown stay queued."""
+        kept = []
+        try:
+            while True:
+                job = self._speech_q.get_nowait()
+                if job is None or job[0] != self._speak_text:
+                    kept.append(job)
+        except queue.Empty:
+            pass
+        for job in kept:
+            self._speech_q.put(job)
+
+    def wait_for_speech(self, timeout: float = None) -> bool:
+        """Block until the texts queued so far have been spoken (or timeout)."""
+        done = threading.Event()
+        self._speech_q.put((done.set, ()))
+        return done.wait(timeout)
+
     # ------------------------------------------------------------------
     # Mic pose via motion recorder
     # ------------------------------------------------------------------
+    def _move_arm(self, chain: str, names: list, angles: list, duration: float, wait: bool):
+        """
+        Interpolate arm joints. With wait=False the call returns right away
+        (the motion runs on the robot while speech starts); a newer command
+        on the same joints interrupts it. Stiffness is set once per chain.
+        """
+        if chain not in self._arm_stiff_set:
+            self.motion_service.setStiffnesses(chain, 1.0)
+            self._arm_stiff_set.add(chain)
+        times = [duration] * len(names)
+        if wait:
+            self.motion_service.angleInterpolation(names, angles, times, True)
+        else:
+            self.motion_service.angleInterpolation(names, angles, times, True, _async=True)
+
     def _mic_up(self, duration: float = 0.8):
         """
         Put LEFT arm in mic pose (body and legs stay as they are).
-        Faster version: default duration reduced from 0.6s to 0.3s.
+        Non-blocking: speech can start while the arm moves up.
         """
         print("[NAO] mic_up() – left arm only")
         if self.test_mode or self.motion_service is None:
@@ -334,29 +578,7 @@ class NaoShowController(object):
             return
 
         try:
-            # Left arm joints
-            names = [
-                "LShoulderPitch",
-                "LShoulderRoll",
-                "LElbowYaw",
-                "LElbowRoll",
-                "LWristYaw",
-            ]
-
-            # Simple mic pose: arm up & in front of mouth
-            angles = [
-                0.5,   # LShoulderPitch  (arm a bit forward)
-                0.25,  # LShoulderRoll   (arm slightly out)
-                -1.2,  # LElbowYaw       (forearm across body)
-                -1.0,  # LElbowRoll      (elbow bent)
-                0.0,   # LWristYaw
-            ]
-
-            # Faster movement: shorter time
-            times = [duration] * len(names)
-
-            self.motion_service.setStiffnesses("LArm", 1.0)
-            self.motion_service.angleInterpolation(names, angles, times, True)
+            self._move_arm("LArm", MIC_JOINTS, MIC_UP_ANGLES, duration, wait=False)
 
         except Exception as e:
             print(f"[NaoShowController] ERROR in mic_up(): {e}")
@@ -365,7 +587,7 @@ class NaoShowController(object):
     def _mic_down(self, duration: float = 0.3):
         """
         Return LEFT arm to a relaxed neutral pose (standing).
-        Faster version: default duration reduced from 0.6s to 0.3s.
+        Blocking: walking or rest usually follows, so the arm must be down first.
         """
         print("[NAO] mic_down() – left arm only")
         if self.test_mode or self.motion_service is None:
@@ -373,28 +595,7 @@ class NaoShowController(object):
             return
 
         try:
-            names = [
-                "LShoulderPitch",
-                "LShoulderRoll",
-                "LElbowYaw",
-                "LElbowRoll",
-                "LWristYaw",
-            ]
-
-            # Neutral-ish standing arm pose
-            angles = [
-                1.4,   # LShoulderPitch
-                0.15,  # LShoulderRoll
-                -1.2,  # LElbowYaw
-                -0.5,  # LElbowRoll
-                0.0,   # LWristYaw
-            ]
-
-            # Faster movement: shorter time
-            times = [duration] * len(names)
-
-            self.motion_service.setStiffnesses("LArm", 1.0)
-            self.motion_service.angleInterpolation(names, angles, times, True)
+            self._move_arm("LArm", MIC_JOINTS, MIC_DOWN_ANGLES, duration, wait=True)
 
         except Exception as e:
             print(f"[NaoShowController] ERROR in mic_down(): {e}")
@@ -405,40 +606,28 @@ class NaoShowController(object):
     def _point_to_screen(self, duration: float = 0.5):
         """
         Point to screen with RIGHT arm while left arm stays in mic pose.
-        Uses direct joint control for speed.
+        Uses direct joint control for speed; non-blocking so speech starts
+        while the arm is still moving.
         """
         print("[NAO] point_to_screen()")
         if self.test_mode or self.motion_service is None:
             print("[NaoShowController] point_to_screen(): TEST_MODE or no ALMotion")
             return
         try:
-            # Right arm joints: RShoulderPitch, RShoulderRoll, RElbowYaw, RElbowRoll, RWristYaw
-            # Pointing forward-right pose (arm extended toward screen)
-            names = ["RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll"]
-            # Shoulder pitch ~0.3 (arm up), roll ~-0.3 (out), elbow extended
-            angles = [0.3, -0.3, 1.0, 0.3]
-            times = [duration] * len(names)
-            
-            self.motion_service.setStiffnesses("RArm", 1.0)
-            self.motion_service.angleInterpolation(names, angles, times, True)
+            self._move_arm("RArm", POINT_JOINTS, POINT_ANGLES, duration, wait=False)
         except Exception as e:
             print(f"[NaoShowController] ERROR in point_to_screen: {e}")
     
     def _arm_neutral(self, duration: float = 0.4):
         """
-        Return RIGHT arm to neutral position (relaxed at side).
+        Return RIGHT arm to neutral position (relaxed at side). Non-blocking.
         """
         print("[NAO] arm_neutral()")
         if self.test_mode or self.motion_service is None:
             print("[NaoShowController] arm_neutral(): TEST_MODE or no ALMotion")
             return
         try:
-            # Neutral standing pose for right arm
-            names = ["RShoulderPitch", "RShoulderRoll", "RElbowYaw", "RElbowRoll"]
-            angles = [1.4, -0.15, 1.2, 0.5]  # Relaxed at side
-            times = [duration] * len(names)
-            
-            self.motion_service.angleInterpolation(names, angles, times, True)
+            self._move_arm("RArm", POINT_JOINTS, POINT_NEUTRAL_ANGLES, duration, wait=False)
         except Exception as e:
             print(f"[NaoShowController] ERROR in arm_neutral: {e}")
 
@@ -509,35 +698,46 @@ class NaoShowController(object):
         try:
             pose = self.motion_service.getRobotPosition(False)
             theta = pose[2]
-            return math.atan2(math.sin(theta), math.cos(theta))
+            return _wrap_pi(theta)
         except Exception as e:
             print(f"[NaoShowController] ERROR in _get_current_heading: {e}")
             return self.heading
 
     def _turn_to_heading(self, target_heading: float,
-                         max_iter: int = 2, tol: float = 0.05):
+                         max_iter: int = 2, tol: float = 0.05,
+                         current_hint: float = None, turn: float = None):
+        """
+        Turn in place to target_heading.
+        current_hint: heading the caller just measured (saves one getRobotPosition).
+        turn: relative angle for the first moveTo. Use it for exact half turns:
+        wrapping a 180° difference would pick the direction by float noise.
+        The heading is re-measured once after each moveTo, and that measurement
+        is reused for the next iteration and as the final heading.
+        """
         if self.motion_service is None:
             print("[NaoShowController] _turn_to_heading(): no ALMotion")
             return
 
-        target = math.atan2(math.sin(target_heading), math.cos(target_heading))
+        target = _wrap_pi(target_heading)
+        current = current_hint if current_hint is not None else self._get_current_heading()
 
         for i in range(max_iter):
             if self._airborne_state:
                 print("[NaoShowController] _turn_to_heading(): airborne, aborting")
                 break
 
-            current = self._get_current_heading()
-            diff = target - current
-            diff = math.atan2(math.sin(diff), math.cos(diff))
+            if i == 0 and turn is not None:
+                diff = turn
+            else:
+                diff = _wrap_pi(target - current)
 
-            print(
-                f"[NaoShowController] _turn_to_heading iter {i}: "
-                f"current={current:.3f}, target={target:.3f}, diff={diff:.3f}"
+            log.debug(
+                "[NaoShowController] _turn_to_heading iter %d: current=%.3f, target=%.3f, diff=%.3f",
+                i, current, target, diff,
             )
 
             if abs(diff) < tol:
-                print("[NaoShowController] _turn_to_heading(): within tolerance")
+                log.debug("[NaoShowController] _turn_to_heading(): within tolerance")
                 break
 
             try:
@@ -546,24 +746,25 @@ class NaoShowController(object):
                 print(f"[NaoShowController] ERROR in moveTo: {e}")
                 break
 
-        self.heading = self._get_current_heading()
+            current = self._get_current_heading()
+
+        self._set_heading(current)
         print(f"[NaoShowController] Heading now ~ {self.heading:.3f} rad")
 
     def _turn_exact_180(self, direction: int = 1):
         current = self._get_current_heading()
-        target = current + direction * math.pi
-        target = math.atan2(math.sin(target), math.cos(target))
+        target = _wrap_pi(current + direction * _PI)
         print(f"[NaoShowController] turn_exact_180(): current={current:.3f}, target={target:.3f}")
-        self._turn_to_heading(target)
+        self._turn_to_heading(target, current_hint=current, turn=direction * _PI)
 
     def _initial_turn_left_90(self):
         if self.motion_service is None:
             print("[NaoShowController] initial_turn_left_90(): no ALMotion")
             return
         current = self._get_current_heading()
-        target = current + math.pi / 2.0
+        target = current + _HALF_PI
         print(f"[NaoShowController] Initial 90° LEFT: current={current:.3f}, target={target:.3f}")
-        self._turn_to_heading(target)
+        self._turn_to_heading(target, current_hint=current)
 
     def _face_audience(self):
         print("[NaoShowController] Facing audience (heading -> 0)")
@@ -572,34 +773,43 @@ class NaoShowController(object):
     # ------------------------------------------------------------------
     # Head / gaze
     # ------------------------------------------------------------------
-    def _set_head(self, yaw: float, pitch: float, duration: float = HEAD_MOVE_TIME):
+    def _set_head(self, yaw: float, pitch: float, speed: float = HEAD_MOVE_SPEED):
         if self.test_mode or self.motion_service is None:
-            print(f"[NaoShowController] set_head(): yaw={yaw:.3f}, pitch={pitch:.3f}")
+            log.debug("[NaoShowController] set_head(): yaw=%.3f, pitch=%.3f", yaw, pitch)
             return
         if self._airborne_state:
             return
         try:
             names = ["HeadYaw", "HeadPitch"]
             angles = [yaw, pitch]
-            self.motion_service.setStiffnesses("Head", 1.0)
-            self.motion_service.angleInterpolation(
-                names, angles, [duration, duration], True
-            )
+            if not self._head_stiff_set:
+                self.motion_service.setStiffnesses("Head", 1.0)
+                self._head_stiff_set = True
+            # setAngles returns immediately; a newer gaze target interrupts this one
+            self.motion_service.setAngles(names, angles, speed)
         except Exception as e:
             print(f"[NaoShowController] ERROR in set_head: {e}")
 
     def _compensate_yaw(self, base_yaw: float) -> float:
         yaw = base_yaw - self.heading
-        return math.atan2(math.sin(yaw), math.cos(yaw))
+        return _wrap_pi(yaw)
+
+    def _set_heading(self, heading: float):
+        """Store new heading and precompute head yaws so gaze ticks do no trig."""
+        self.heading = heading
+        self._compensated_yaw = {
+            name: self._compensate_yaw(base_yaw)
+            for name, base_yaw in GAZE_BASE_YAWS.items()
+        }
 
     def _look_audience_left(self):
-        self._set_head(self._compensate_yaw(AUDIENCE_LEFT_YAW), AUDIENCE_LEFT_PITCH)
+        self._set_head(self._compensated_yaw["audience_left"], AUDIENCE_LEFT_PITCH)
 
     def _look_audience_right(self):
-        self._set_head(self._compensate_yaw(AUDIENCE_RIGHT_YAW), AUDIENCE_RIGHT_PITCH)
+        self._set_head(self._compensated_yaw["audience_right"], AUDIENCE_RIGHT_PITCH)
 
     def _look_screen(self):
-        self._set_head(self._compensate_yaw(SCREEN_YAW), SCREEN_PITCH)
+        self._set_head(self._compensated_yaw["screen"], SCREEN_PITCH)
 
     def start_face_tracking(self):
         """Start face tracking met alleen het hoofd."""
@@ -655,40 +865,49 @@ class NaoShowController(object):
             print(f"[NaoShowController] ERROR in _walk_thread_target: {e}")
 
     def _start_walk_async(self, straight: float, side: float, curve: float = 0.0):
-        print(f"[NaoShowController] start_walk_async({straight}, {side}, {curve})")
+        """Queue a walk; returns immediately (stopMove + moveTo run on the motion worker)."""
+        log.debug("[NaoShowController] start_walk_async(%s, %s, %s)", straight, side, curve)
         if self.test_mode:
             print("[NaoShowController] TEST_MODE: simulate walk")
             return
         if self._airborne_state:
             print("[NaoShowController] Not walking, airborne")
             return
-        try:
-            if self.motion_service is not None:
-                self.motion_service.stopMove()
-        except Exception as e:
-            print(f"[NaoShowController] WARNING stopMove: {e}")
+        with self._walk_lock:
+            self._pending_walk = (straight, side, curve)
+        self._motion_q.put((self._run_pending_walk, ()))
 
-        try:
-            t = threading.Thread(
-                target=self._walk_thread_target,
-                args=(straight, side, curve),
-                daemon=True,
-            )
-            t.start()
-            self._walk_thread = t
-        except Exception as e:
-            print(f"[NaoShowController] ERROR starting walk thread: {e}")
+    def _run_pending_walk(self):
+        """
+        Motion worker job: stop the current move and start the latest queued walk.
+        Walks superseded before the worker got to them are skipped.
+        """
+        with self._walk_lock:
+            walk, self._pending_walk = self._pending_walk, None
+        if walk is None or self._airborne_state:
+            return
+        straight, side, curve = walk
+
+        if self.motion_service is not None:
             try:
-                self.nao.motion.request(
-                    NaoqiMoveToRequest(x=straight, y=side, theta=curve)
-                )
-            except Exception as e2:
-                print(f"[NaoShowController] ERROR in blocking walk: {e2}")
+                self.motion_service.stopMove()
+            except Exception as e:
+                print(f"[NaoShowController] WARNING stopMove: {e}")
+            # Run moveTo asynchronously next to the gaze loop; stopMove ends it
+            try:
+                self.motion_service.moveTo(straight, side, curve, _async=True)
+                return
+            except Exception as e:
+                print(f"[NaoShowController] WARNING async moveTo: {e}")
+
+        self._walk_thread_target(straight, side, curve)
 
     def _stop_walk(self):
-        print("[NaoShowController] stop_walk()")
+        log.debug("[NaoShowController] stop_walk()")
         if self.test_mode:
             return
+        with self._walk_lock:
+            self._pending_walk = None  # don't start a queued walk after stopping
         if self.motion_service is not None:
             try:
                 self.motion_service.stopMove()
@@ -699,9 +918,10 @@ class NaoShowController(object):
     # Airborne monitoring
     # ------------------------------------------------------------------
     def _handle_airborne(self):
-        if self._airborne_handling:
+        now = time.monotonic()
+        if now < self._airborne_handled_until:
             return
-        self._airborne_handling = True
+        self._airborne_handled_until = now + 2.0
 
         if self._airborne_events == 1:
             line = "Put me down, put me down, or I am going to explode!"
@@ -710,13 +930,38 @@ class NaoShowController(object):
 
         print(f"[NaoShowController] AIRBORNE! Event #{self._airborne_events}")
 
-        self._stop_walk()
-        self._stop_all_speech()
-        self._set_face_color(255, 0, 0, duration=0.1)
+        self._clear_speech_queue()
+        self._panic_stop()
         self._say_loud_fast_async(line)
 
-        time.sleep(2.0)
-        self._airborne_handling = False
+    def _panic_stop(self):
+        """
+        Stop walking, stop all speech and turn the face red.
+        The three calls are independent, so they are sent as parallel qi futures
+        and awaited together instead of three sequential round-trips.
+        """
+        services = (self.motion_service, self.tts_service, self.leds_service)
+        if self.test_mode or None in services:
+            self._stop_walk()
+            self._stop_all_speech()
+            self._set_face_color(255, 0, 0, duration=0.1)
+            return
+
+        print("[NaoShowController] Panic stop: stopMove + stopAll + red face")
+        try:
+            futures = [
+                self.motion_service.stopMove(_async=True),
+                self.tts_service.stopAll(_async=True),
+                self.leds_service.fadeRGB("FaceLeds", 0xFF0000, 0.1, _async=True),
+            ]
+        except Exception as e:
+            print(f"[NaoShowController] ERROR in panic_stop: {e}")
+            return
+        for future in futures:
+            try:
+                future.value()
+            except Exception as e:
+                print(f"[NaoShowController] ERROR in panic_stop: {e}")
 
     def _handle_grounded_after_airborne(self):
         if self._ground_countdown_running:
@@ -724,10 +969,24 @@ class NaoShowController(object):
         self._ground_countdown_running = True
         print("[NaoShowController] Grounded after airborne: countdown")
 
+        # Let the panic line finish first so the two never overlap
+        panic = self._panic_future
+        if panic is not None:
+            try:
+                panic.wait(PANIC_WAIT_MS)
+            except Exception as e:
+                print(f"[NaoShowController] ERROR waiting for panic say: {e}")
+
         self._set_face_color(255, 0, 0, duration=0.2)
+        # One number per second: the speech itself counts toward the second
+        next_tick = time.monotonic()
         for i in range(4, 0, -1):
+            if self._airborne_state:  # picked up again mid-countdown
+                self._ground_countdown_running = False
+                return
+            next_tick += COUNTDOWN_STEP
             self._say_slow_blocking(str(i))
-            time.sleep(1.0)
+            time.sleep(max(0.0, next_tick - time.monotonic()))
 
         self._say_slow_blocking("Just kidding.")
         self._set_face_color(255, 255, 255, duration=0.5)
@@ -738,41 +997,42 @@ class NaoShowController(object):
             print("[NaoShowController] Airborne monitor disabled")
             return
 
-        print("[NaoShowController] Airborne monitor started")
-        last_state = None
+        print("[NaoShowController] Airborne monitor started (polling)")
 
         while not self._stop_airborne_monitor:
             try:
                 val = self.memory_service.getData("footContact")
-                airborne = (val < 0.5)
             except Exception as e:
                 print(f"[NaoShowController] ERROR reading footContact: {e}")
-                airborne = False
-
-            if not airborne:
-                if not self._airborne_armed:
-                    print("[NaoShowController] Ground detected, arming airborne detection")
-                self._airborne_armed = True
-
-            if airborne and last_state is not True and self._airborne_armed:
-                self._airborne_state = True
-                self._airborne_events += 1
-                threading.Thread(target=self._handle_airborne, daemon=True).start()
-            elif (not airborne) and last_state is not False:
-                if self._airborne_state:
-                    t = threading.Thread(
-                        target=self._handle_grounded_after_airborne,
-                        daemon=True,
-                    )
-                    t.start()
-                    self._ground_thread = t
-                self._airborne_state = False
-
-            last_state = airborne
+                val = 1.0
+            self._on_foot_contact(val)
             time.sleep(0.1)
 
         print("[NaoShowController] Airborne monitor stopped")
 
+    def _on_foot_contact(self, value):
+        """footContact update (event callback or poll): detect lift-off / touchdown."""
+        airborne = (value < 0.5)
+        last_state = self._last_foot_state
+
+        if not airborne:
+            if not self._airborne_armed:
+                print("[NaoShowController] Ground detected, arming airborne detection")
+            self._airborne_armed = True
+
+        if airborne and last_state is not True and self._airborne_armed:
+            self._airborne_state = True
+            self._phase_stop.set()
+            self._airborne_events += 1
+            self._event_q.put((self._handle_airborne, ()))
+        elif (not airborne) and last_state is not False:
+            if self._airborne_state:
+                self._voice_q.put((self._handle_grounded_after_airborne, ()))
+            self._airborne_state = False
+            self._phase_stop.clear()
+
+        self._last_foot_state = airborne
+
     # ------------------------------------------------------------------
     # Walk phases + gaze
     # ------------------------------------------------------------------
@@ -781,34 +1041,31 @@ class NaoShowController(object):
         leg_sign = +1 → richting A langs het podium
         leg_sign = -1 → richting B
         """
-        if leg_sign > 0:
-            pattern = [
-                self._look_audience_left,
-                self._look_audience_right,
-            ]
-        else:
-            pattern = [
-                self._look_audience_right,
-                self._look_audience_left,
-            ]
-        func = pattern[cycle_index % len(pattern)]
-        func()
+        pattern = self._gaze_pattern_pos if leg_sign > 0 else self._gaze_pattern_neg
+        pattern[cycle_index & self._gaze_mask]()
 
 
     def _walk_phase_with_gaze(self, straight: float, side: float,
                               phase_duration: float, cycle_index: int,
                               leg_sign: int) -> int:
-        print(f"[NaoShowController] walk_phase_with_gaze({phase_duration:.1f}s, leg_sign={leg_sign})")
+        log.debug("[NaoShowController] walk_phase_with_gaze(%.1fs, leg_sign=%d)", phase_duration, leg_sign)
         self._start_walk_async(straight, side, curve=0.0)
 
-        start = time.time()
-        while time.time() - start < phase_duration:
+        # Fixed-cadence ticks: time spent in the gaze call does not add drift
+        now = time.monotonic()
+        deadline = now + phase_duration
+        next_tick = now
+        while now < deadline:
             if self._airborne_state:
                 print("[NaoShowController] walk_phase: airborne, break")
                 break
             self._update_gaze_during_speech(cycle_index, leg_sign)
             cycle_index += 1
-            time.sleep(GAZE_STEP_DT)
+            next_tick += GAZE_STEP_DT
+            if self._phase_stop.wait(max(0.0, next_tick - time.monotonic())):
+                print("[NaoShowController] walk_phase: airborne, break")
+                break
+            now = time.monotonic()
 
         self._stop_walk()
         return cycle_index
@@ -818,12 +1075,12 @@ class NaoShowController(object):
         Pacing pattern until total_duration is exceeded or airborne.
         Assumes NAO already facing along the stage (e.g. after 90° left).
         """
-        start_all = time.time()
+        start_all = time.monotonic()
         cycle_index = 0
         leg_sign = +1
 
         while True:
-            elapsed = time.time() - start_all
+            elapsed = time.monotonic() - start_all
             remaining = total_duration - elapsed
             if remaining <= 0:
                 break
@@ -840,7 +1097,7 @@ class NaoShowController(object):
             if self._airborne_state:
                 break
 
-            elapsed = time.time() - start_all
+            elapsed = time.monotonic() - start_all
             if elapsed >= total_duration:
                 break
 
@@ -873,7 +1130,8 @@ class NaoShowController(object):
             print("[NaoShowController] TEST_MODE: mic+walk+gaze simulated")
             return
 
-        if self.mic_up_recording is None or self.mic_down_recording is None:
+        mic_up_recording, mic_down_recording = self._load_mic_recordings()
+        if mic_up_recording is None or mic_down_recording is None:
             print("[NaoShowController] mic_up/down not loaded, just speaking")
             self._say_async(text)
             return
@@ -896,7 +1154,7 @@ class NaoShowController(object):
 
         self._walk_and_turn_pattern_for_duration(approx_duration)
 
-        time.sleep(2.0)
+        self._phase_stop.wait(2.0)
 
         # mic pose down, arms normal
         self._mic_down()
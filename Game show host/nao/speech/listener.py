@@ -35,7 +35,8 @@ class NaoListener:
         self.nao = nao
         
         # Load Google credentials
-        keyfile_json = json.load(open(google_keyfile_path))
+        with open(google_keyfile_path) as keyfile:
+            keyfile_json = json.load(keyfile)
         
         # Setup Google STT (streaming, real-time)
         stt_conf = GoogleSpeechToTextConf(
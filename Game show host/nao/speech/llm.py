@@ -1,7 +1,5 @@
-from groq import Groq
-import os
+import threading
 from dotenv import load_dotenv
-from pathlib import Path
 
 # Load environment variables from .env file
 # This makes GROQ_API_KEY available to the Groq client
@@ -9,8 +7,50 @@ load_dotenv()
 
 import re
 
+# Idle seconds a Groq connection is kept open (httpx default is 5s, shorter
+# than the gaps between jokes, so every joke would pay DNS + TLS again)
+LLM_KEEPALIVE_S = 60.0
+
+_client = None
+_client_lock = threading.Lock()
+
+def _groq_client():
+    """
+    Shared Groq client, created on first use.
+    The groq import happens here so it stays off the startup path, and all
+    LLM calls reuse one client (and its HTTP connections). The warm-up
+    thread and the LLM pool can ask at the same time, so creation is locked.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                from groq import Groq
+                http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=2,
+                                        keepalive_expiry=LLM_KEEPALIVE_S),
+                    timeout=httpx.Timeout(30.0, connect=5.0),
+                )
+                # API key is read from GROQ_API_KEY environment variable
+                _client = Groq(http_client=http_client)
+    return _client
+
+def warm_up_llm():
+    """
+    Create the shared Groq client ahead of the first joke and open its
+    connection (DNS + TLS) with a free models.list call.
+    """
+    try:
+        _groq_client().models.list()
+    except Exception as e:
+        print(f"[LLM] Warm-up failed (first joke will connect): {e}")
+
+SENTENCE_END = re.compile(r"[.!?]")
+TTS_PUNCTUATION = re.compile(r"[.,!?]")
+
 def tts_clean(text: str) -> str:
-    return re.sub(r"[.,!?]", "", text)
+    return TTS_PUNCTUATION.sub("", text)
 
 def get_llm_response_groq(user_message: str, system_prompt: str = None, model: str = "llama-3.1-8b-instant") -> str:
     """
@@ -22,9 +62,7 @@ def get_llm_response_groq(user_message: str, system_prompt: str = None, model: s
     - "mixtral-8x7b-32768"       -> Good balance
     """
     try:
-        # Initialize Groq client
-        # API key is read from GROQ_API_KEY environment variable
-        client = Groq()
+        client = _groq_client()
         
         # Build the messages list
         messages = []
@@ -93,36 +131,51 @@ Your Output: "Mike Hunt is here! Anyone else having trouble saying that with a s
 #response = get_llm_response_groq(user_message_str, system_prompt_pre_quiz)
 #print(f"Response: {response}")
 
+def open_llm_stream(user_message: str, system_prompt: str = None, model: str = "llama-3.1-8b-instant"):
+    """
+    Send a streaming request to Groq and return the chunk stream.
+    Can run in the background (e.g. while NAO is still talking) and be
+    handed to stream_llm_response_to_nao() via `prefetched`.
+    """
+    client = _groq_client()
+
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": user_message})
+
+    print(f"[LLM] Streaming request to Groq {model}...")
+    return client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=0.8,
+        max_tokens=50,
+        stream=True,
+    )
+
 def stream_llm_response_to_nao(
     nao_quiz_master,
     user_message: str,
     system_prompt: str = None,
-    model: str = "llama-3.1-8b-instant"
+    model: str = "llama-3.1-8b-instant",
+    prefetched=None
 ) -> str:
     """
     Stream LLM response from Groq and let NAO start talking earlier.
-    ⁠ nao_quiz_master ⁠ is your NaoQuizMaster instance (for .say_with_mic()).
+    ⁠ nao_quiz_master ⁠ is your NaoQuizMaster instance (for .say_queued()).
+    ⁠ prefetched ⁠ is an optional Future of open_llm_stream() for the same
+    message, started earlier so the model's first tokens are already on the way.
     Returns the full generated text.
     """
     try:
-        client = Groq()
-
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": user_message})
-
-        print(f"[LLM] Streaming request to Groq {model}...")
-        stream = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=0.8,
-            max_tokens=50,
-            stream=True,
-        )
+        if prefetched is not None:
+            stream = prefetched.result()
+        else:
+            stream = open_llm_stream(user_message, system_prompt, model)
 
         full_text = ""
         buffer = ""
+        spoken = None  # Future of the last queued piece
 
         for chunk in stream:
             delta = chunk.choices[0].delta.content or ""
@@ -132,16 +185,21 @@ def stream_llm_response_to_nao(
             full_text += delta
             buffer += delta
 
-            # When buffer is big enough or reaches a sentence end, speak it
-            if len(buffer) > 40 or any(p in buffer for p in [".", "!", "?"]):
-                
-                nao_quiz_master.say_with_mic(tts_clean(buffer))
-
-                buffer = ""
+            # Speak up to the last sentence end (or the last word once the buffer is long).
+            # Pieces are queued, so the stream keeps reading while NAO talks.
+            ends = [m.end() for m in SENTENCE_END.finditer(buffer)]
+            cut = ends[-1] if ends else (buffer.rfind(" ") + 1 if len(buffer) > 40 else 0)
+            if cut:
+                spoken = nao_quiz_master.say_queued(tts_clean(buffer[:cut]))
+                buffer = buffer[cut:]
 
         # Flush remaining text at the end
         if buffer.strip():
-            nao_quiz_master.say_with_mic(tts_clean(buffer))
+            spoken = nao_quiz_master.say_queued(tts_clean(buffer))
+
+        # Return once NAO has finished speaking, like before
+        if spoken is not None:
+            spoken.result()
 
         print(f"[LLM] Streaming complete: {len(full_text)} characters")
         return full_text
@@ -150,3 +208,19 @@ def stream_llm_response_to_nao(
         print(f"[LLM] Streaming error: {str(e)}")
         return f"Error: Could not stream response from LLM - {str(e)}"
 
+def say_llm_text(nao_quiz_master, text: str) -> str:
+    """
+    Speak an already generated response the way a streamed one is spoken:
+    sentence by sentence through .say_queued(). Returns once NAO is done.
+    """
+    spoken = None
+    start = 0
+    for m in SENTENCE_END.finditer(text):
+        spoken = nao_quiz_master.say_queued(tts_clean(text[start:m.end()]))
+        start = m.end()
+    if text[start:].strip():
+        spoken = nao_quiz_master.say_queued(tts_clean(text[start:]))
+    if spoken is not None:
+        spoken.result()
+    return text
+
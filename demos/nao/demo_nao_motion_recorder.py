@@ -126,7 +126,7 @@ class NaoMotionRecorderDemo(SICApplication):
                 Stiffness(stiffness=0.7, joints=self.chain)
             )
 
-            recording = NaoqiMotionRecording.load(self.motion_name)
+            # Replay the recording we just got back instead of reading the saved file again
             self.nao.motion_record.request(PlayRecording(recording))
 
             # 7) Always end with a rest